@@ -54,6 +54,10 @@ class FileSettings(object):
     and vice versa
     """
 
+    # Every statement in a file reads its settings, so keep them compact
+    __slots__ = ('notation', 'units', '_zero_suppression', '_zeros', 'format',
+                 'angle_units')
+
     def __init__(self, notation='absolute', units='inch',
                  zero_suppression=None, format=(2, 5), zeros=None,
                  angle_units='degrees'):
@@ -30,7 +30,7 @@ from .cam import CamFile, FileSettings
 from .excellon_statements import *
 from .excellon_tool import ExcellonToolDefinitionParser
 from .primitives import Drill, Slot
-from .utils import inch, metric
+from .utils import inch, metric, bounding_box_union
 
 
 try:
@@ -39,6 +39,9 @@ except(ImportError):
     from io import StringIO
 
 
+# First characters of coordinate (drill hit) lines
+_COORDINATE_AXES = frozenset(('X', 'Y'))
+
 
 def read(filename):
     """ Read data from filename and return an ExcellonFile
@@ -95,6 +98,9 @@ class DrillHit(object):
         Center position of the drill.
 
     """
+
+    __slots__ = ('tool', 'position')
+
     def __init__(self, tool, position):
         self.tool = tool
         self.position = position
@@ -121,7 +127,8 @@ class DrillHit(object):
         return ((min_x, max_x), (min_y, max_y))
 
     def offset(self, x_offset=0, y_offset=0):
-        self.position = tuple(map(operator.add, self.position, (x_offset, y_offset)))
+        x, y = self.position
+        self.position = (x + x_offset, y + y_offset)
 
     def __str__(self):
         return 'Hit (%f, %f) {%s}' % (self.position[0], self.position[1], self.tool)
@@ -131,6 +138,8 @@ class DrillSlot(object):
     A slot is created between two points. The way the slot is created depends on the statement used to create it
     """
 
+    __slots__ = ('tool', 'start', 'end', 'slot_type')
+
     TYPE_ROUT = 1
     TYPE_G85 = 2
 
@@ -164,8 +173,10 @@ class DrillSlot(object):
         return ((min_x, max_x), (min_y, max_y))
 
     def offset(self, x_offset=0, y_offset=0):
-        self.start = tuple(map(operator.add, self.start, (x_offset, y_offset)))
-        self.end = tuple(map(operator.add, self.end, (x_offset, y_offset)))
+        start_x, start_y = self.start
+        end_x, end_y = self.end
+        self.start = (start_x + x_offset, start_y + y_offset)
+        self.end = (end_x + x_offset, end_y + y_offset)
 
 
 class ExcellonFile(CamFile):
@@ -223,15 +234,10 @@ class ExcellonFile(CamFile):
 
     @property
     def bounding_box(self):
-        xmin = ymin = 100000000000
-        xmax = ymax = -100000000000
-        for hit in self.hits:
-            bbox = hit.bounding_box
-            xmin = min(bbox[0][0], xmin)
-            xmax = max(bbox[0][1], xmax)
-            ymin = min(bbox[1][0], ymin)
-            ymax = max(bbox[1][1], ymax)
-        return ((xmin, xmax), (ymin, ymax))
+        if not self.hits:
+            return ((100000000000, -100000000000),
+                    (100000000000, -100000000000))
+        return bounding_box_union(hit.bounding_box for hit in self.hits)
 
     def report(self, filename=None):
         """ Print or save drill report
@@ -680,7 +686,7 @@ class ExcellonParser(object):
                 self.hits.append(DrillHit(self.active_tool, tuple(self.pos)))
                 self.active_tool._hit()
 
-        elif line[0] in ['X', 'Y']:
+        elif line[0] in _COORDINATE_AXES:
             if 'G85' in line:
                 stmt = SlotStmt.from_excellon(line, self._settings())
 
@@ -759,7 +765,7 @@ class ExcellonParser(object):
         """
 
         existing = self.tools.get(tool.number)
-        if existing and existing.plated == None:
+        if existing and existing.plated is None:
             existing.plated = tool.plated
 
         self.comment_tools[tool.number] = tool
@@ -895,18 +895,18 @@ class CoordStmt(Statement):
         j = stmt_dict.get('j')
         op = stmt_dict.get('op')
 
+        # Every coordinate in the file is parsed here, so the settings are
+        # looked up once for all four fields.
+        number_format = settings.format
+        zero_suppression = settings.zero_suppression
         if x is not None:
-            x = parse_gerber_value(stmt_dict.get('x'), settings.format,
-                                   settings.zero_suppression)
+            x = parse_gerber_value(x, number_format, zero_suppression)
         if y is not None:
-            y = parse_gerber_value(stmt_dict.get('y'), settings.format,
-                                   settings.zero_suppression)
+            y = parse_gerber_value(y, number_format, zero_suppression)
         if i is not None:
-            i = parse_gerber_value(stmt_dict.get('i'), settings.format,
-                                   settings.zero_suppression)
+            i = parse_gerber_value(i, number_format, zero_suppression)
         if j is not None:
-            j = parse_gerber_value(stmt_dict.get('j'), settings.format,
-                                   settings.zero_suppression)
+            j = parse_gerber_value(j, number_format, zero_suppression)
         return cls(function, x, y, i, j, op, settings)
 
     @classmethod
@@ -1066,7 +1066,9 @@ class CoordStmt(Statement):
 
         # TODO I would like to refactor this so that the function is handled separately and then
         # TODO this isn't required
-        return self.function != None and self.op == None and self.x == None and self.y == None and self.i == None and self.j == None
+        return (self.function is not None and self.op is None and
+                self.x is None and self.y is None and
+                self.i is None and self.j is None)
 
 
 class ApertureStmt(Statement):
@@ -17,12 +17,140 @@
 
 
 import math
-from operator import add
-from itertools import combinations
+from collections import namedtuple
+from operator import add, attrgetter
 from .utils import validate_coordinates, inch, metric, convex_hull
-from .utils import rotate_point, nearly_equal
+from .utils import MILLIMETERS_PER_INCH, bounding_box_union
+from .utils import nearly_equal
 
 
+# Module-level bindings for math functions used in hot geometry code. This
+# saves a global and an attribute lookup per call.
+_atan2 = math.atan2
+_cos = math.cos
+_hypot = math.hypot
+_radians = math.radians
+_sin = math.sin
+
+_HALF_PI = math.pi / 2.
+_TWO_PI = 2 * math.pi
+
+
+def _build_axis_crossing_table():
+    """ Precompute which axis directions a counterclockwise arc crosses.
+
+    Axis direction k is at k * 90 degrees (+x, +y, -x, -y). The table is
+    indexed by ``(wrap * 5 + first) * 4 + last``, where `first` is the first
+    axis direction at or after the start angle (0-4), `last` is the last
+    axis direction at or before the end angle (0-3) and `wrap` is set if the
+    arc passes through 0 degrees on its way from start to end. Each entry is
+    a 4-bit mask with bit k set if direction k is crossed.
+    """
+    table = []
+    for wrap in (False, True):
+        for first in range(5):
+            for last in range(4):
+                mask = 0
+                for k in range(4):
+                    if ((k >= first or k <= last) if wrap
+                            else first <= k <= last):
+                        mask |= 1 << k
+                table.append(mask)
+    return tuple(table)
+
+
+_AXIS_CROSSINGS = _build_axis_crossing_table()
+
+
+def _segment_extents(start, end):
+    """ Extents of a straight segment as (min x, max x, min y, max y) """
+    start_x, start_y = start
+    end_x, end_y = end
+    if start_x < end_x:
+        min_x, max_x = start_x, end_x
+    else:
+        min_x, max_x = end_x, start_x
+    if start_y < end_y:
+        min_y, max_y = start_y, end_y
+    else:
+        min_y, max_y = end_y, start_y
+    return min_x, max_x, min_y, max_y
+
+
+#: Unit polygon templates keyed by (sides, rotation). Pads in a file share a
+#: handful of apertures, so this stays small; the cache is cleared once it
+#: exceeds 64 entries.
+_UNIT_POLYGONS = {}
+_UNIT_POLYGONS_MAX = 64
+
+
+def _unit_polygon(sides, rotation):
+    """ (cos, sin) of each vertex angle of a regular polygon.
+
+    Parameters
+    ----------
+    sides : int
+        Number of vertices.
+
+    rotation : float
+        Angle of the first vertex in degrees.
+
+    Returns
+    -------
+    points : tuple
+        Vertices of the polygon with unit radius centred on the origin.
+    """
+    key = (sides, rotation)
+    points = _UNIT_POLYGONS.get(key)
+    if points is None:
+        start = _radians(rotation)
+        step = _TWO_PI / sides
+        angles = [start + step * i for i in range(sides)]
+        points = tuple((_cos(angle), _sin(angle)) for angle in angles)
+        if len(_UNIT_POLYGONS) >= _UNIT_POLYGONS_MAX:
+            _UNIT_POLYGONS.clear()
+        _UNIT_POLYGONS[key] = points
+    return points
+
+
+def _place_points(offsets, center, cos_theta, sin_theta):
+    """ Rotate offsets from a centre point and translate them onto it.
+
+    Parameters
+    ----------
+    offsets : iterable of tuple
+        (dx, dy) offsets of each point from the centre, before rotation.
+
+    center : tuple
+        (x, y) point the offsets are relative to.
+
+    cos_theta, sin_theta : float
+        Cosine and sine of the rotation angle.
+
+    Returns
+    -------
+    points : list
+        Absolute (x, y) coordinates of the rotated points.
+    """
+    x, y = center
+    if sin_theta == 0 and cos_theta == 1:
+        return [(x + dx, y + dy) for dx, dy in offsets]
+    return [(x + dx * cos_theta - dy * sin_theta,
+             y + dx * sin_theta + dy * cos_theta)
+            for dx, dy in offsets]
+
+
+# Directions of the ChamferRectangle corners from its centre, in the order
+# of its corners flags: upper right, upper left, lower left, lower right
+_CHAMFER_CORNER_SIGNS = ((1, 1), (-1, 1), (-1, -1), (1, -1))
+
+
+# Simple shapes an Obround is composed of
+Subshapes = namedtuple('Subshapes', 'circle1 circle2 rectangle')
+
+
+# Cached attributes shared by all primitives, cleared by Primitive._changed()
+_BASE_MEMOIZED = ('_cos_sin', '_bounding_box', '_vertices', '_segments')
 
 
 class Primitive(object):
@@ -48,15 +176,23 @@ class Primitive(object):
         Name of the electrical net the primitive belongs to
     """
 
+    __slots__ = ('level_polarity', 'net_name', '_units', '_rotation',
+                 '_cos_sin', '_bounding_box', '_vertices', '_segments')
+
+    #: Names of subclass-specific cached attributes cleared by _changed()
+    _memoized = ()
+
+    #: Names of attributes holding lengths, scaled by to_inch()/to_metric(),
+    #: and an attrgetter fetching all of them at once
+    _to_convert = ()
+    _to_convert_getter = None
+
     def __init__(self, level_polarity='dark', rotation=0, units=None, net_name=None):
         self.level_polarity = level_polarity
         self.net_name = net_name
-        self._to_convert = list()
-        self._memoized = list()
         self._units = units
         self._rotation = rotation
-        self._cos_theta = math.cos(math.radians(rotation))
-        self._sin_theta = math.sin(math.radians(rotation))
+        self._cos_sin = None
         self._bounding_box = None
         self._vertices = None
         self._segments = None
@@ -68,7 +204,29 @@ class Primitive(object):
                                   'implemented in subclass')
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        if self is other:
+            return True
+        if not isinstance(other, Primitive):
+            return NotImplemented
+        if type(self) is not type(other):
+            return False
+        return self._state() == other._state()
+
+    def _state(self):
+        """ Collect instance attributes for comparison.
+
+        Primitives use __slots__, so there is no __dict__ to compare
+        directly (unless a subclass doesn't declare its own slots).
+        Memoized values are left out, so reading a derived property doesn't
+        make otherwise equal primitives compare unequal.
+        """
+        state = dict(getattr(self, '__dict__', {}))
+        memoized = _BASE_MEMOIZED + self._memoized
+        for cls in type(self).__mro__:
+            for attr in cls.__dict__.get('__slots__', ()):
+                if attr not in memoized and hasattr(self, attr):
+                    state[attr] = getattr(self, attr)
+        return state
 
     @property
     def units(self):
@@ -85,10 +243,35 @@ class Primitive(object):
 
     @rotation.setter
     def rotation(self, value):
+        if value == self._rotation:
+            return
         self._changed()
         self._rotation = value
-        self._cos_theta = math.cos(math.radians(value))
-        self._sin_theta = math.sin(math.radians(value))
+        self._cos_sin = None
+
+    @property
+    def _cos_theta(self):
+        if self._cos_sin is None:
+            self._cos_sin = self._rotation_cos_sin(self._rotation)
+        return self._cos_sin[0]
+
+    @property
+    def _sin_theta(self):
+        if self._cos_sin is None:
+            self._cos_sin = self._rotation_cos_sin(self._rotation)
+        return self._cos_sin[1]
+
+    @staticmethod
+    def _rotation_cos_sin(rotation):
+        """ Return (cos, sin) of a rotation in degrees.
+
+        Unrotated primitives are by far the most common case, so the trig
+        calls are skipped entirely for them.
+        """
+        if rotation == 0:
+            return 1.0, 0.0
+        theta = _radians(rotation)
+        return _cos(theta), _sin(theta)
 
     @property
     def vertices(self):
@@ -96,10 +279,16 @@ class Primitive(object):
 
     @property
     def segments(self):
+        """ Edges of the primitive's outline as (start, end) vertex pairs.
+
+        Vertices are stored in order around the outline, so each one is
+        joined to the next and the last one to the first.
+        """
         if self._segments is None:
-            if self.vertices is not None and len(self.vertices):
-                self._segments = [segment for segment in
-                                  combinations(self.vertices, 2)]
+            vertices = self.vertices
+            if vertices is not None and len(vertices):
+                self._segments = list(zip(vertices,
+                                          vertices[1:] + vertices[:1]))
         return self._segments
 
     @property
@@ -113,6 +302,43 @@ class Primitive(object):
         raise NotImplementedError('Bounding box calculation must be '
                                   'implemented in subclass')
 
+    def intersect_candidates(self, index):
+        """ Find primitives that may touch this one.
+
+        Parameters
+        ----------
+        index : :class:`gerber.spatial.PrimitiveIndex`
+            Index over the primitives to check against.
+
+        Returns
+        -------
+        primitives : list
+            Indexed primitives, other than this one, whose bounding box
+            intersects this primitive's bounding box.
+        """
+        return [p for p in index.candidates(self.bounding_box)
+                if p is not self]
+
+    def _axis_aligned_dims(self):
+        """ Memoized (width, height) of the axis aligned box around the
+        rotated shape.
+
+        Used by subclasses with width, height and an _axis_aligned_size
+        slot. Shapes that aren't bounded by their rotated rectangle override
+        this.
+        """
+        if self._axis_aligned_size is None:
+            width = self.width
+            height = self.height
+            if not self._rotation:
+                self._axis_aligned_size = (width, height)
+                return self._axis_aligned_size
+            cos_theta = abs(self._cos_theta)
+            sin_theta = abs(self._sin_theta)
+            self._axis_aligned_size = (cos_theta * width + sin_theta * height,
+                                       cos_theta * height + sin_theta * width)
+        return self._axis_aligned_size
+
     @property
     def bounding_box_no_aperture(self):
         """ Calculate bouxing box without considering the aperture
@@ -124,66 +350,83 @@ class Primitive(object):
         """
         return self.bounding_box
 
+    def _convertible_items(self):
+        """ (name, value) pairs of the attributes in _to_convert
+        """
+        if not self._to_convert:
+            return []
+        values = self._to_convert_getter(self)
+        if len(self._to_convert) == 1:
+            values = (values,)
+        return zip(self._to_convert, values)
+
     def to_inch(self):
         """ Convert primitive units to inches.
         """
         if self.units == 'metric':
             self.units = 'inch'
-            for attr, value in [(attr, getattr(self, attr))
-                                for attr in self._to_convert]:
-                if hasattr(value, 'to_inch'):
+            for attr, value in self._convertible_items():
+                if value is None:
+                    continue
+                elif hasattr(value, 'to_inch'):
                     value.to_inch()
+                elif isinstance(value, (tuple, list)):
+                    if not value:
+                        continue
+                    elif hasattr(value[0], 'to_inch'):
+                        for v in value:
+                            v.to_inch()
+                    elif isinstance(value[0], tuple):
+                        setattr(self, attr,
+                                [(x / MILLIMETERS_PER_INCH,
+                                  y / MILLIMETERS_PER_INCH)
+                                 for x, y in value])
+                    else:
+                        setattr(self, attr,
+                                tuple([v / MILLIMETERS_PER_INCH
+                                       for v in value]))
                 else:
-                    try:
-                        if len(value) > 1:
-                            if hasattr(value[0], 'to_inch'):
-                                for v in value:
-                                    v.to_inch()
-                            elif isinstance(value[0], tuple):
-                                setattr(self, attr,
-                                        [tuple(map(inch, point))
-                                         for point in value])
-                            else:
-                                setattr(self, attr, tuple(map(inch, value)))
-                    except:
-                        if value is not None:
-                            setattr(self, attr, inch(value))
+                    setattr(self, attr, inch(value))
 
     def to_metric(self):
         """ Convert primitive units to metric.
         """
         if self.units == 'inch':
             self.units = 'metric'
-            for attr, value in [(attr, getattr(self, attr))
-                                for attr in self._to_convert]:
-                if hasattr(value, 'to_metric'):
+            for attr, value in self._convertible_items():
+                if value is None:
+                    continue
+                elif hasattr(value, 'to_metric'):
                     value.to_metric()
+                elif isinstance(value, (tuple, list)):
+                    if not value:
+                        continue
+                    elif hasattr(value[0], 'to_metric'):
+                        for v in value:
+                            v.to_metric()
+                    elif isinstance(value[0], tuple):
+                        setattr(self, attr,
+                                [(x * MILLIMETERS_PER_INCH,
+                                  y * MILLIMETERS_PER_INCH)
+                                 for x, y in value])
+                    else:
+                        setattr(self, attr,
+                                tuple([v * MILLIMETERS_PER_INCH
+                                       for v in value]))
                 else:
-                    try:
-                        if len(value) > 1:
-                            if hasattr(value[0], 'to_metric'):
-                                for v in value:
-                                    v.to_metric()
-                            elif isinstance(value[0], tuple):
-                                setattr(self, attr,
-                                        [tuple(map(metric, point))
-                                         for point in value])
-                            else:
-                                setattr(self, attr, tuple(map(metric, value)))
-                    except:
-                        if value is not None:
-                            setattr(self, attr, metric(value))
+                    setattr(self, attr, metric(value))
 
     def offset(self, x_offset=0, y_offset=0):
         """ Move the primitive by the specified x and y offset amount.
 
         values are specified in the primitive's native units
         """
+        if x_offset == 0 and y_offset == 0:
+            return
         if hasattr(self, 'position'):
             self._changed()
-            self.position = tuple([coord + offset for coord, offset
-                                   in zip(self.position,
-                                          (x_offset, y_offset))])
+            x, y = self.position
+            self.position = (x + x_offset, y + y_offset)
 
     def to_statement(self):
         pass
@@ -206,13 +449,19 @@ class Line(Primitive):
     """
     """
 
+    __slots__ = ('_start', '_end', 'aperture', '_bounding_box_no_aperture')
+
+    _memoized = ('_bounding_box_no_aperture',)
+
+    _to_convert = ('start', 'end', 'aperture')
+    _to_convert_getter = attrgetter(*_to_convert)
+
     def __init__(self, start, end, aperture, level_polarity=None, **kwargs):
-        super(Line, self).__init__(**kwargs)
-        self.level_polarity = level_polarity
+        super(Line, self).__init__(level_polarity=level_polarity, **kwargs)
         self._start = start
         self._end = end
         self.aperture = aperture
-        self._to_convert = ['start', 'end', 'aperture']
+        self._bounding_box_no_aperture = None
 
     @property
     def flashed(self):
@@ -238,70 +487,76 @@ class Line(Primitive):
 
     @property
     def angle(self):
-        delta_x, delta_y = tuple(
-            [end - start for end, start in zip(self.end, self.start)])
-        angle = math.atan2(delta_y, delta_x)
-        return angle
+        start_x, start_y = self._start
+        end_x, end_y = self._end
+        return _atan2(end_y - start_y, end_x - start_x)
 
     @property
     def bounding_box(self):
         if self._bounding_box is None:
-            if isinstance(self.aperture, Circle):
-                width_2 = self.aperture.radius
-                height_2 = width_2
+            aperture = self.aperture
+            if isinstance(aperture, (Circle, Polygon)):
+                # A polygon lies within its circumscribed circle
+                width_2 = height_2 = aperture.radius
             else:
-                width_2 = self.aperture.width / 2.
-                height_2 = self.aperture.height / 2.
-            min_x = min(self.start[0], self.end[0]) - width_2
-            max_x = max(self.start[0], self.end[0]) + width_2
-            min_y = min(self.start[1], self.end[1]) - height_2
-            max_y = max(self.start[1], self.end[1]) + height_2
-            self._bounding_box = ((min_x, max_x), (min_y, max_y))
+                width_2 = aperture.width / 2.
+                height_2 = aperture.height / 2.
+            (min_x, max_x), (min_y, max_y) = self.bounding_box_no_aperture
+            self._bounding_box = ((min_x - width_2, max_x + width_2),
+                                  (min_y - height_2, max_y + height_2))
         return self._bounding_box
 
     @property
     def bounding_box_no_aperture(self):
         '''Gets the bounding box without the aperture'''
-        min_x = min(self.start[0], self.end[0])
-        max_x = max(self.start[0], self.end[0])
-        min_y = min(self.start[1], self.end[1])
-        max_y = max(self.start[1], self.end[1])
-        return ((min_x, max_x), (min_y, max_y))
+        if self._bounding_box_no_aperture is None:
+            min_x, max_x, min_y, max_y = _segment_extents(self.start, self.end)
+            self._bounding_box_no_aperture = ((min_x, max_x), (min_y, max_y))
+        return self._bounding_box_no_aperture
 
     @property
     def vertices(self):
         if self._vertices is None:
             start = self.start
             end = self.end
-            if isinstance(self.aperture, Rectangle):
-                width = self.aperture.width
-                height = self.aperture.height
-
-                # Find all the corners of the start and end position
-                start_ll = (start[0] - (width / 2.), start[1] - (height / 2.))
-                start_lr = (start[0] + (width / 2.), start[1] - (height / 2.))
-                start_ul = (start[0] - (width / 2.), start[1] + (height / 2.))
-                start_ur = (start[0] + (width / 2.), start[1] + (height / 2.))
-                end_ll = (end[0] - (width / 2.), end[1] - (height / 2.))
-                end_lr = (end[0] + (width / 2.), end[1] - (height / 2.))
-                end_ul = (end[0] - (width / 2.), end[1] + (height / 2.))
-                end_ur = (end[0] + (width / 2.), end[1] + (height / 2.))
-
-                # The line is defined by the convex hull of the points
-                self._vertices = convex_hull((start_ll, start_lr, start_ul, start_ur, end_ll, end_lr, end_ul, end_ur))
-            elif isinstance(self.aperture, Polygon):
-                points = [map(add, point, vertex)
-                          for vertex in self.aperture.vertices
-                          for point in (start, end)]
+            aperture = self.aperture
+            if isinstance(aperture, Rectangle):
+                # The swept rectangle is the convex hull of the corners at
+                # both ends, which can be written down directly: a box if
+                # the line is axis aligned, otherwise a hexagon. Vertices
+                # are listed counterclockwise from the lower left.
+                w = aperture.width / 2.
+                h = aperture.height / 2.
+                (x0, y0), (x1, y1) = start, end
+                if x1 < x0:
+                    x0, y0, x1, y1 = x1, y1, x0, y0
+                if x0 == x1 or y0 == y1:
+                    min_y, max_y = (y0, y1) if y0 < y1 else (y1, y0)
+                    self._vertices = [(x0 - w, min_y - h), (x1 + w, min_y - h),
+                                      (x1 + w, max_y + h), (x0 - w, max_y + h)]
+                elif y0 < y1:
+                    self._vertices = [(x0 - w, y0 - h), (x0 + w, y0 - h),
+                                      (x1 + w, y1 - h), (x1 + w, y1 + h),
+                                      (x1 - w, y1 + h), (x0 - w, y0 + h)]
+                else:
+                    self._vertices = [(x0 - w, y0 - h), (x1 - w, y1 - h),
+                                      (x1 + w, y1 - h), (x1 + w, y1 + h),
+                                      (x0 + w, y0 + h), (x0 - w, y0 + h)]
+            elif isinstance(aperture, Polygon):
+                points = [(x + vertex_x, y + vertex_y)
+                          for vertex_x, vertex_y in aperture.vertices
+                          for x, y in (start, end)]
                 self._vertices = convex_hull(points)
         return self._vertices
 
     def offset(self, x_offset=0, y_offset=0):
+        if x_offset == 0 and y_offset == 0:
+            return
         self._changed()
-        self.start = tuple([coord + offset for coord, offset
-                            in zip(self.start, (x_offset, y_offset))])
-        self.end = tuple([coord + offset for coord, offset
-                          in zip(self.end, (x_offset, y_offset))])
+        start_x, start_y = self._start
+        end_x, end_y = self._end
+        self._start = (start_x + x_offset, start_y + y_offset)
+        self._end = (end_x + x_offset, end_y + y_offset)
 
     def equivalent(self, other, offset):
 
@@ -324,17 +579,32 @@ class Arc(Primitive):
     """
     """
 
+    __slots__ = ('_start', '_end', '_center', '_direction', 'aperture',
+                 '_quadrant_mode', '_bounding_box_no_aperture', '_radius',
+                 '_start_angle', '_end_angle', '_sweep_angle',
+                 '_clamped_angles')
+
+    _memoized = ('_bounding_box_no_aperture', '_radius', '_start_angle',
+                 '_end_angle', '_sweep_angle', '_clamped_angles')
+
+    _to_convert = ('start', 'end', 'center', 'aperture')
+    _to_convert_getter = attrgetter(*_to_convert)
+
     def __init__(self, start, end, center, direction, aperture, quadrant_mode,
             level_polarity=None, **kwargs):
-        super(Arc, self).__init__(**kwargs)
-        self.level_polarity = level_polarity
+        super(Arc, self).__init__(level_polarity=level_polarity, **kwargs)
         self._start = start
         self._end = end
         self._center = center
-        self.direction = direction
+        self._direction = direction
         self.aperture = aperture
         self._quadrant_mode = quadrant_mode
-        self._to_convert = ['start', 'end', 'center', 'aperture']
+        self._bounding_box_no_aperture = None
+        self._radius = None
+        self._start_angle = None
+        self._end_angle = None
+        self._sweep_angle = None
+        self._clamped_angles = None
 
     @property
     def flashed(self):
@@ -367,6 +637,15 @@ class Arc(Primitive):
         self._changed()
         self._center = value
 
+    @property
+    def direction(self):
+        return self._direction
+
+    @direction.setter
+    def direction(self, value):
+        self._changed()
+        self._direction = value
+
     @property
     def quadrant_mode(self):
         return self._quadrant_mode
@@ -378,161 +657,145 @@ class Arc(Primitive):
 
     @property
     def radius(self):
-        dy, dx = tuple([start - center for start, center
-                        in zip(self.start, self.center)])
-        return math.sqrt(dy ** 2 + dx ** 2)
+        if self._radius is None:
+            self._update_start_geometry()
+        return self._radius
 
     @property
     def start_angle(self):
-        dx, dy = tuple([start - center for start, center
-                        in zip(self.start, self.center)])
-        return math.atan2(dy, dx)
+        if self._start_angle is None:
+            self._update_start_geometry()
+        return self._start_angle
+
+    def _update_start_geometry(self):
+        """ Memoize radius and start angle from one start-center vector.
+
+        The two are almost always needed together (bounding box, rendering),
+        so computing them at once saves unpacking the points twice.
+        """
+        start_x, start_y = self._start
+        center_x, center_y = self._center
+        dx = start_x - center_x
+        dy = start_y - center_y
+        self._radius = _hypot(dx, dy)
+        self._start_angle = _atan2(dy, dx)
 
     @property
     def end_angle(self):
-        dx, dy = tuple([end - center for end, center
-                        in zip(self.end, self.center)])
-        return math.atan2(dy, dx)
+        if self._end_angle is None:
+            end_x, end_y = self._end
+            center_x, center_y = self._center
+            self._end_angle = _atan2(end_y - center_y, end_x - center_x)
+        return self._end_angle
+
+    def _angles(self):
+        """ Memoized start and end angles clamped to [0, 2 pi).
+
+        Shared by the sweep angle and bounding box, which both work from
+        the clamped angles.
+        """
+        if self._clamped_angles is None:
+            self._clamped_angles = ((self.start_angle + _TWO_PI) % _TWO_PI,
+                                    (self.end_angle + _TWO_PI) % _TWO_PI)
+        return self._clamped_angles
 
     @property
     def sweep_angle(self):
-        two_pi = 2 * math.pi
-        theta0 = (self.start_angle + two_pi) % two_pi
-        theta1 = (self.end_angle + two_pi) % two_pi
-        if self.direction == 'counterclockwise':
-            return abs(theta1 - theta0)
-        else:
-            theta0 += two_pi
-            return abs(theta0 - theta1) % two_pi
+        if self._sweep_angle is None:
+            theta0, theta1 = self._angles()
+            if self.direction == 'counterclockwise':
+                self._sweep_angle = abs(theta1 - theta0)
+            else:
+                theta0 += _TWO_PI
+                self._sweep_angle = abs(theta0 - theta1) % _TWO_PI
+        return self._sweep_angle
+
+    def _axis_crossings(self):
+        """ Bitmask of the axis directions the arc passes through.
+
+        Bit k is set if the arc sweeps through k * 90 degrees, i.e. bit 0 is
+        +x, bit 1 is +y, bit 2 is -x and bit 3 is -y. Single-quadrant arcs
+        never cross an axis.
+        """
+        if self.quadrant_mode != 'multi-quadrant':
+            return 0
+        theta0, theta1 = self._angles()
+        if self.direction != 'counterclockwise':
+            # A clockwise arc covers the same angles as the counterclockwise
+            # arc from its end to its start.
+            theta0, theta1 = theta1, theta0
+        first = int(-(-theta0 // _HALF_PI))
+        last = int(theta1 // _HALF_PI)
+        wrap = 1 if theta0 >= theta1 else 0
+        return _AXIS_CROSSINGS[(wrap * 5 + first) * 4 + last]
 
     @property
     def bounding_box(self):
         if self._bounding_box is None:
-            two_pi = 2 * math.pi
-            theta0 = (self.start_angle + two_pi) % two_pi
-            theta1 = (self.end_angle + two_pi) % two_pi
-            points = [self.start, self.end]
-            if self.quadrant_mode == 'multi-quadrant':
-                if self.direction == 'counterclockwise':
-                    # Passes through 0 degrees
-                    if theta0 >= theta1:
-                        points.append((self.center[0] + self.radius, self.center[1]))
-                    # Passes through 90 degrees
-                    if (((theta0 <= math.pi / 2.) and ((theta1 >= math.pi / 2.) or (theta1 <= theta0)))
-                        or ((theta1 > math.pi / 2.) and (theta1 <= theta0))):
-                        points.append((self.center[0], self.center[1] + self.radius))
-                    # Passes through 180 degrees
-                    if ((theta0 <= math.pi and (theta1 >= math.pi or theta1 <= theta0))
-                        or ((theta1 > math.pi) and (theta1 <= theta0))):
-                        points.append((self.center[0] - self.radius, self.center[1]))
-                    # Passes through 270 degrees
-                    if (theta0 <= math.pi * 1.5 and (theta1 >= math.pi * 1.5 or theta1 <= theta0)
-                        or ((theta1 > math.pi * 1.5) and (theta1 <= theta0))):
-                        points.append((self.center[0], self.center[1] - self.radius))
-                else:
-                    # Passes through 0 degrees
-                    if theta1 >= theta0:
-                        points.append((self.center[0] + self.radius, self.center[1]))
-                    # Passes through 90 degrees
-                    if (((theta1 <= math.pi / 2.) and (theta0 >= math.pi / 2. or theta0 <= theta1))
-                        or ((theta0 > math.pi / 2.) and (theta0 <= theta1))):
-                        points.append((self.center[0], self.center[1] + self.radius))
-                    # Passes through 180 degrees
-                    if (((theta1 <= math.pi) and (theta0 >= math.pi or theta0 <= theta1))
-                        or ((theta0 > math.pi) and (theta0 <= theta1))):
-                        points.append((self.center[0] - self.radius, self.center[1]))
-                    # Passes through 270 degrees
-                    if (((theta1 <= math.pi * 1.5) and (theta0 >= math.pi * 1.5 or theta0 <= theta1))
-                        or ((theta0 > math.pi * 1.5) and (theta0 <= theta1))):
-                        points.append((self.center[0], self.center[1] - self.radius))
-            x, y = zip(*points)
-            if hasattr(self.aperture, 'radius'):
-                min_x = min(x) - self.aperture.radius
-                max_x = max(x) + self.aperture.radius
-                min_y = min(y) - self.aperture.radius
-                max_y = max(y) + self.aperture.radius
+            (min_x, max_x), (min_y, max_y) = self.bounding_box_no_aperture
+            aperture = self.aperture
+            if hasattr(aperture, 'radius'):
+                pad_x = pad_y = aperture.radius
             else:
-                min_x = min(x) - self.aperture.width
-                max_x = max(x) + self.aperture.width
-                min_y = min(y) - self.aperture.height
-                max_y = max(y) + self.aperture.height
-
-            self._bounding_box = ((min_x, max_x), (min_y, max_y))
+                pad_x = aperture.width
+                pad_y = aperture.height
+            self._bounding_box = ((min_x - pad_x, max_x + pad_x),
+                                  (min_y - pad_y, max_y + pad_y))
         return self._bounding_box
 
     @property
     def bounding_box_no_aperture(self):
         '''Gets the bounding box without considering the aperture'''
-        two_pi = 2 * math.pi
-        theta0 = (self.start_angle + two_pi) % two_pi
-        theta1 = (self.end_angle + two_pi) % two_pi
-        points = [self.start, self.end]
-        if self.quadrant_mode == 'multi-quadrant':
-            if self.direction == 'counterclockwise':
-                # Passes through 0 degrees
-                if theta0 >= theta1:
-                    points.append((self.center[0] + self.radius, self.center[1]))
-                # Passes through 90 degrees
-                if (((theta0 <= math.pi / 2.) and (
-                    (theta1 >= math.pi / 2.) or (theta1 <= theta0)))
-                    or ((theta1 > math.pi / 2.) and (theta1 <= theta0))):
-                    points.append((self.center[0], self.center[1] + self.radius))
-                # Passes through 180 degrees
-                if ((theta0 <= math.pi and (theta1 >= math.pi or theta1 <= theta0))
-                    or ((theta1 > math.pi) and (theta1 <= theta0))):
-                    points.append((self.center[0] - self.radius, self.center[1]))
-                # Passes through 270 degrees
-                if (theta0 <= math.pi * 1.5 and (
-                        theta1 >= math.pi * 1.5 or theta1 <= theta0)
-                    or ((theta1 > math.pi * 1.5) and (theta1 <= theta0))):
-                    points.append((self.center[0], self.center[1] - self.radius))
-            else:
-                # Passes through 0 degrees
-                if theta1 >= theta0:
-                    points.append((self.center[0] + self.radius, self.center[1]))
-                # Passes through 90 degrees
-                if (((theta1 <= math.pi / 2.) and (
-                        theta0 >= math.pi / 2. or theta0 <= theta1))
-                    or ((theta0 > math.pi / 2.) and (theta0 <= theta1))):
-                    points.append((self.center[0], self.center[1] + self.radius))
-                # Passes through 180 degrees
-                if (((theta1 <= math.pi) and (theta0 >= math.pi or theta0 <= theta1))
-                    or ((theta0 > math.pi) and (theta0 <= theta1))):
-                    points.append((self.center[0] - self.radius, self.center[1]))
-                # Passes through 270 degrees
-                if (((theta1 <= math.pi * 1.5) and (
-                        theta0 >= math.pi * 1.5 or theta0 <= theta1))
-                    or ((theta0 > math.pi * 1.5) and (theta0 <= theta1))):
-                    points.append((self.center[0], self.center[1] - self.radius))
-        x, y = zip(*points)
-
-        min_x = min(x)
-        max_x = max(x)
-        min_y = min(y)
-        max_y = max(y)
-        return ((min_x, max_x), (min_y, max_y))
+        if self._bounding_box_no_aperture is None:
+            min_x, max_x, min_y, max_y = _segment_extents(self.start, self.end)
+            crossings = self._axis_crossings()
+            if crossings:
+                center_x, center_y = self.center
+                radius = self.radius
+                if crossings & 1:
+                    max_x = max(max_x, center_x + radius)
+                if crossings & 2:
+                    max_y = max(max_y, center_y + radius)
+                if crossings & 4:
+                    min_x = min(min_x, center_x - radius)
+                if crossings & 8:
+                    min_y = min(min_y, center_y - radius)
+            self._bounding_box_no_aperture = ((min_x, max_x), (min_y, max_y))
+        return self._bounding_box_no_aperture
 
     def offset(self, x_offset=0, y_offset=0):
+        if x_offset == 0 and y_offset == 0:
+            return
         self._changed()
-        self.start = tuple(map(add, self.start, (x_offset, y_offset)))
-        self.end = tuple(map(add, self.end, (x_offset, y_offset)))
-        self.center = tuple(map(add, self.center, (x_offset, y_offset)))
+        start_x, start_y = self._start
+        end_x, end_y = self._end
+        center_x, center_y = self._center
+        self._start = (start_x + x_offset, start_y + y_offset)
+        self._end = (end_x + x_offset, end_y + y_offset)
+        self._center = (center_x + x_offset, center_y + y_offset)
 
 
 class Circle(Primitive):
     """
     """
 
+    __slots__ = ('_position', '_diameter', 'hole_diameter', 'hole_width',
+                 'hole_height')
+
+    _to_convert = ('position', 'diameter', 'hole_diameter', 'hole_width',
+                   'hole_height')
+    _to_convert_getter = attrgetter(*_to_convert)
+
     def __init__(self, position, diameter, hole_diameter=None,
                  hole_width=0, hole_height=0, **kwargs):
         super(Circle, self).__init__(**kwargs)
-        validate_coordinates(position)
+        if __debug__:
+            validate_coordinates(position)
         self._position = position
         self._diameter = diameter
         self.hole_diameter = hole_diameter
         self.hole_width = hole_width
         self.hole_height = hole_height
-        self._to_convert = ['position', 'diameter', 'hole_diameter', 'hole_width', 'hole_height']
 
     @property
     def flashed(self):
@@ -558,26 +821,30 @@ class Circle(Primitive):
 
     @property
     def radius(self):
-        return self.diameter / 2.
+        return self._diameter / 2.
 
     @property
     def hole_radius(self):
-        if self.hole_diameter != None:
+        if self.hole_diameter is not None:
             return self.hole_diameter / 2.
         return None
 
     @property
     def bounding_box(self):
         if self._bounding_box is None:
-            min_x = self.position[0] - self.radius
-            max_x = self.position[0] + self.radius
-            min_y = self.position[1] - self.radius
-            max_y = self.position[1] + self.radius
-            self._bounding_box = ((min_x, max_x), (min_y, max_y))
+            # Circles are the most common primitive (pads), so read the
+            # slots directly rather than through the properties
+            x, y = self._position
+            radius = self._diameter / 2.
+            self._bounding_box = ((x - radius, x + radius),
+                                  (y - radius, y + radius))
         return self._bounding_box
 
     def offset(self, x_offset=0, y_offset=0):
-        self.position = tuple(map(add, self.position, (x_offset, y_offset)))
+        if x_offset == 0 and y_offset == 0:
+            return
+        x, y = self.position
+        self.position = (x + x_offset, y + y_offset)
 
     def equivalent(self, other, offset):
         '''Is this the same as the other circle, ignoring the offiset?'''
@@ -596,13 +863,22 @@ class Circle(Primitive):
 class Ellipse(Primitive):
     """
     """
+
+    __slots__ = ('_position', '_width', '_height', '_axis_aligned_size')
+
+    _memoized = ('_axis_aligned_size',)
+
+    _to_convert = ('position', 'width', 'height')
+    _to_convert_getter = attrgetter(*_to_convert)
+
     def __init__(self, position, width, height, **kwargs):
         super(Ellipse, self).__init__(**kwargs)
-        validate_coordinates(position)
+        if __debug__:
+            validate_coordinates(position)
         self._position = position
         self._width = width
         self._height = height
-        self._to_convert = ['position', 'width', 'height']
+        self._axis_aligned_size = None
 
     @property
     def flashed(self):
@@ -638,26 +914,35 @@ class Ellipse(Primitive):
     @property
     def bounding_box(self):
         if self._bounding_box is None:
-            min_x = self.position[0] - (self.axis_aligned_width / 2.0)
-            max_x = self.position[0] + (self.axis_aligned_width / 2.0)
-            min_y = self.position[1] - (self.axis_aligned_height / 2.0)
-            max_y = self.position[1] + (self.axis_aligned_height / 2.0)
-            self._bounding_box = ((min_x, max_x), (min_y, max_y))
+            x, y = self.position
+            aa_width, aa_height = self._axis_aligned_dims()
+            width_2 = aa_width / 2.
+            height_2 = aa_height / 2.
+            self._bounding_box = ((x - width_2, x + width_2),
+                                  (y - height_2, y + height_2))
         return self._bounding_box
 
+    def _axis_aligned_dims(self):
+        if self._axis_aligned_size is None:
+            width = self.width
+            height = self.height
+            if not self._rotation:
+                self._axis_aligned_size = (width, height)
+                return self._axis_aligned_size
+            cos_theta = self._cos_theta
+            sin_theta = self._sin_theta
+            self._axis_aligned_size = (
+                _hypot(width * cos_theta, height * sin_theta),
+                _hypot(width * sin_theta, height * cos_theta))
+        return self._axis_aligned_size
+
     @property
     def axis_aligned_width(self):
-        ux = (self.width / 2.) * math.cos(math.radians(self.rotation))
-        vx = (self.height / 2.) * \
-            math.cos(math.radians(self.rotation) + (math.pi / 2.))
-        return 2 * math.sqrt((ux * ux) + (vx * vx))
+        return self._axis_aligned_dims()[0]
 
     @property
     def axis_aligned_height(self):
-        uy = (self.width / 2.) * math.sin(math.radians(self.rotation))
-        vy = (self.height / 2.) * \
-            math.sin(math.radians(self.rotation) + (math.pi / 2.))
-        return 2 * math.sqrt((uy * uy) + (vy * vy))
+        return self._axis_aligned_dims()[1]
 
 
 class Rectangle(Primitive):
@@ -668,21 +953,27 @@ class Rectangle(Primitive):
     then you don't need to worry about rotation
     """
 
+    __slots__ = ('_position', '_width', '_height', 'hole_diameter',
+                 'hole_width', 'hole_height', '_axis_aligned_size')
+
+    _memoized = ('_axis_aligned_size',)
+
+    _to_convert = ('position', 'width', 'height', 'hole_diameter',
+                   'hole_width', 'hole_height')
+    _to_convert_getter = attrgetter(*_to_convert)
+
     def __init__(self, position, width, height, hole_diameter=0,
                  hole_width=0, hole_height=0, **kwargs):
         super(Rectangle, self).__init__(**kwargs)
-        validate_coordinates(position)
+        if __debug__:
+            validate_coordinates(position)
         self._position = position
         self._width = width
         self._height = height
         self.hole_diameter = hole_diameter
         self.hole_width = hole_width
         self.hole_height = hole_height
-        self._to_convert = ['position', 'width', 'height', 'hole_diameter',
-                            'hole_width', 'hole_height']
-        # TODO These are probably wrong when rotated
-        self._lower_left = None
-        self._upper_right = None
+        self._axis_aligned_size = None
 
     @property
     def flashed(self):
@@ -718,51 +1009,65 @@ class Rectangle(Primitive):
     @property
     def hole_radius(self):
         """The radius of the hole. If there is no hole, returns None"""
-        if self.hole_diameter != None:
+        if self.hole_diameter is not None:
             return self.hole_diameter / 2.
         return None
 
     @property
     def upper_right(self):
-        return (self.position[0] + (self.axis_aligned_width / 2.),
-                self.position[1] + (self.axis_aligned_height / 2.))
+        (_, max_x), (_, max_y) = self.bounding_box
+        return (max_x, max_y)
 
     @property
     def lower_left(self):
-        return (self.position[0] - (self.axis_aligned_width / 2.),
-                self.position[1] - (self.axis_aligned_height / 2.))
+        (min_x, _), (min_y, _) = self.bounding_box
+        return (min_x, min_y)
 
     @property
     def bounding_box(self):
         if self._bounding_box is None:
-            ll = (self.position[0] - (self.axis_aligned_width / 2.),
-                  self.position[1] - (self.axis_aligned_height / 2.))
-            ur = (self.position[0] + (self.axis_aligned_width / 2.),
-                  self.position[1] + (self.axis_aligned_height / 2.))
-            self._bounding_box = ((ll[0], ur[0]), (ll[1], ur[1]))
+            x, y = self.position
+            aa_width, aa_height = self._axis_aligned_dims()
+            width_2 = aa_width / 2.
+            height_2 = aa_height / 2.
+            self._bounding_box = ((x - width_2, x + width_2),
+                                  (y - height_2, y + height_2))
         return self._bounding_box
 
     @property
     def vertices(self):
         if self._vertices is None:
+            # Corners (-w, -h), (-w, h), (w, h), (w, -h) rotated about the
+            # centre, with the rotation terms computed once for all four.
+            # Most rectangles are unrotated and skip the rotation entirely.
+            x, y = self.position
             delta_w = self.width / 2.
             delta_h = self.height / 2.
-            ll = ((self.position[0] - delta_w), (self.position[1] - delta_h))
-            ul = ((self.position[0] - delta_w), (self.position[1] + delta_h))
-            ur = ((self.position[0] + delta_w), (self.position[1] + delta_h))
-            lr = ((self.position[0] + delta_w), (self.position[1] - delta_h))
-            self._vertices = [((x * self._cos_theta - y * self._sin_theta),
-                               (x * self._sin_theta + y * self._cos_theta))
-                              for x, y in [ll, ul, ur, lr]]
+            if not self._rotation:
+                self._vertices = [(x - delta_w, y - delta_h),
+                                  (x - delta_w, y + delta_h),
+                                  (x + delta_w, y + delta_h),
+                                  (x + delta_w, y - delta_h)]
+                return self._vertices
+            cos_theta = self._cos_theta
+            sin_theta = self._sin_theta
+            cw = cos_theta * delta_w
+            sw = sin_theta * delta_w
+            ch = cos_theta * delta_h
+            sh = sin_theta * delta_h
+            self._vertices = [(x - cw + sh, y - sw - ch),
+                              (x - cw - sh, y - sw + ch),
+                              (x + cw - sh, y + sw + ch),
+                              (x + cw + sh, y + sw - ch)]
         return self._vertices
 
     @property
     def axis_aligned_width(self):
-        return (self._cos_theta * self.width + self._sin_theta * self.height)
+        return self._axis_aligned_dims()[0]
 
     @property
     def axis_aligned_height(self):
-        return (self._cos_theta * self.height + self._sin_theta * self.width)
+        return self._axis_aligned_dims()[1]
 
     def equivalent(self, other, offset):
         """Is this the same as the other rect, ignoring the offset?"""
@@ -788,13 +1093,21 @@ class Diamond(Primitive):
     """
     """
 
+    __slots__ = ('_position', '_width', '_height', '_axis_aligned_size')
+
+    _memoized = ('_axis_aligned_size',)
+
+    _to_convert = ('position', 'width', 'height')
+    _to_convert_getter = attrgetter(*_to_convert)
+
     def __init__(self, position, width, height, **kwargs):
         super(Diamond, self).__init__(**kwargs)
-        validate_coordinates(position)
+        if __debug__:
+            validate_coordinates(position)
         self._position = position
         self._width = width
         self._height = height
-        self._to_convert = ['position', 'width', 'height']
+        self._axis_aligned_size = None
 
     @property
     def flashed(self):
@@ -830,11 +1143,12 @@ class Diamond(Primitive):
     @property
     def bounding_box(self):
         if self._bounding_box is None:
-            ll = (self.position[0] - (self.axis_aligned_width / 2.),
-                  self.position[1] - (self.axis_aligned_height / 2.))
-            ur = (self.position[0] + (self.axis_aligned_width / 2.),
-                  self.position[1] + (self.axis_aligned_height / 2.))
-            self._bounding_box = ((ll[0], ur[0]), (ll[1], ur[1]))
+            x, y = self.position
+            aa_width, aa_height = self._axis_aligned_dims()
+            width_2 = aa_width / 2.
+            height_2 = aa_height / 2.
+            self._bounding_box = ((x - width_2, x + width_2),
+                                  (y - height_2, y + height_2))
         return self._bounding_box
 
     @property
@@ -842,36 +1156,43 @@ class Diamond(Primitive):
         if self._vertices is None:
             delta_w = self.width / 2.
             delta_h = self.height / 2.
-            top = (self.position[0], (self.position[1] + delta_h))
-            right = ((self.position[0] + delta_w), self.position[1])
-            bottom = (self.position[0], (self.position[1] - delta_h))
-            left = ((self.position[0] - delta_w), self.position[1])
-            self._vertices = [(((x * self._cos_theta) - (y * self._sin_theta)),
-                               ((x * self._sin_theta) + (y * self._cos_theta)))
-                              for x, y in [top, right, bottom, left]]
+            # top, right, bottom, left
+            points = [(0, delta_h), (delta_w, 0), (0, -delta_h), (-delta_w, 0)]
+            self._vertices = _place_points(points, self.position,
+                                           self._cos_theta, self._sin_theta)
         return self._vertices
 
     @property
     def axis_aligned_width(self):
-        return (self._cos_theta * self.width + self._sin_theta * self.height)
+        return self._axis_aligned_dims()[0]
 
     @property
     def axis_aligned_height(self):
-        return (self._cos_theta * self.height + self._sin_theta * self.width)
+        return self._axis_aligned_dims()[1]
 
 
 class ChamferRectangle(Primitive):
     """
     """
+
+    __slots__ = ('_position', '_width', '_height', '_chamfer', '_corners',
+                 '_axis_aligned_size')
+
+    _memoized = ('_axis_aligned_size',)
+
+    _to_convert = ('position', 'width', 'height', 'chamfer')
+    _to_convert_getter = attrgetter(*_to_convert)
+
     def __init__(self, position, width, height, chamfer, corners=None, **kwargs):
         super(ChamferRectangle, self).__init__(**kwargs)
-        validate_coordinates(position)
+        if __debug__:
+            validate_coordinates(position)
         self._position = position
         self._width = width
         self._height = height
         self._chamfer = chamfer
         self._corners = corners if corners is not None else [True] * 4
-        self._to_convert = ['position', 'width', 'height', 'chamfer']
+        self._axis_aligned_size = None
 
     @property
     def flashed(self):
@@ -925,11 +1246,12 @@ class ChamferRectangle(Primitive):
     @property
     def bounding_box(self):
         if self._bounding_box is None:
-            ll = (self.position[0] - (self.axis_aligned_width / 2.),
-                  self.position[1] - (self.axis_aligned_height / 2.))
-            ur = (self.position[0] + (self.axis_aligned_width / 2.),
-                  self.position[1] + (self.axis_aligned_height / 2.))
-            self._bounding_box = ((ll[0], ur[0]), (ll[1], ur[1]))
+            x, y = self.position
+            aa_width, aa_height = self._axis_aligned_dims()
+            width_2 = aa_width / 2.
+            height_2 = aa_height / 2.
+            self._bounding_box = ((x - width_2, x + width_2),
+                                  (y - height_2, y + height_2))
         return self._bounding_box
 
     @property
@@ -938,60 +1260,53 @@ class ChamferRectangle(Primitive):
             vertices = []
             delta_w = self.width / 2.
             delta_h = self.height / 2.
-            # order is UR, UL, LL, LR
-            rect_corners = [
-                ((self.position[0] + delta_w), (self.position[1] + delta_h)),
-                ((self.position[0] - delta_w), (self.position[1] + delta_h)),
-                ((self.position[0] - delta_w), (self.position[1] - delta_h)),
-                ((self.position[0] + delta_w), (self.position[1] - delta_h))
-            ]
-            for idx, params in enumerate(zip(rect_corners, self.corners)):
-                corner, chamfered = params
-                x, y = corner
+            chamfer = self.chamfer
+            # Corners are relative to the centre until rotated below. A
+            # chamfer cuts a corner back towards the centre along both edges.
+            for (sign_x, sign_y), chamfered in zip(_CHAMFER_CORNER_SIGNS,
+                                                   self.corners):
+                x = sign_x * delta_w
+                y = sign_y * delta_h
                 if chamfered:
-                    if idx == 0:
-                        vertices.append((x - self.chamfer, y))
-                        vertices.append((x, y - self.chamfer))
-                    elif idx == 1:
-                        vertices.append((x + self.chamfer, y))
-                        vertices.append((x, y - self.chamfer))
-                    elif idx == 2:
-                        vertices.append((x + self.chamfer, y))
-                        vertices.append((x, y + self.chamfer))
-                    elif idx == 3:
-                        vertices.append((x - self.chamfer, y))
-                        vertices.append((x, y + self.chamfer))
+                    vertices.append((x - sign_x * chamfer, y))
+                    vertices.append((x, y - sign_y * chamfer))
                 else:
-                    vertices.append(corner)
-            self._vertices = [((x * self._cos_theta - y * self._sin_theta),
-                               (x * self._sin_theta + y * self._cos_theta))
-                              for x, y in vertices]
+                    vertices.append((x, y))
+            self._vertices = _place_points(vertices, self.position,
+                                           self._cos_theta, self._sin_theta)
         return self._vertices
 
     @property
     def axis_aligned_width(self):
-        return (self._cos_theta * self.width +
-                self._sin_theta * self.height)
+        return self._axis_aligned_dims()[0]
 
     @property
     def axis_aligned_height(self):
-        return (self._cos_theta * self.height +
-                self._sin_theta * self.width)
+        return self._axis_aligned_dims()[1]
 
 
 class RoundRectangle(Primitive):
     """
     """
 
+    __slots__ = ('_position', '_width', '_height', '_radius', '_corners',
+                 '_axis_aligned_size')
+
+    _memoized = ('_axis_aligned_size',)
+
+    _to_convert = ('position', 'width', 'height', 'radius')
+    _to_convert_getter = attrgetter(*_to_convert)
+
     def __init__(self, position, width, height, radius, corners, **kwargs):
         super(RoundRectangle, self).__init__(**kwargs)
-        validate_coordinates(position)
+        if __debug__:
+            validate_coordinates(position)
         self._position = position
         self._width = width
         self._height = height
         self._radius = radius
         self._corners = corners
-        self._to_convert = ['position', 'width', 'height', 'radius']
+        self._axis_aligned_size = None
 
     @property
     def flashed(self):
@@ -1045,40 +1360,50 @@ class RoundRectangle(Primitive):
     @property
     def bounding_box(self):
         if self._bounding_box is None:
-            ll = (self.position[0] - (self.axis_aligned_width / 2.),
-                  self.position[1] - (self.axis_aligned_height / 2.))
-            ur = (self.position[0] + (self.axis_aligned_width / 2.),
-                  self.position[1] + (self.axis_aligned_height / 2.))
-            self._bounding_box = ((ll[0], ur[0]), (ll[1], ur[1]))
+            x, y = self.position
+            aa_width, aa_height = self._axis_aligned_dims()
+            width_2 = aa_width / 2.
+            height_2 = aa_height / 2.
+            self._bounding_box = ((x - width_2, x + width_2),
+                                  (y - height_2, y + height_2))
         return self._bounding_box
 
     @property
     def axis_aligned_width(self):
-        return (self._cos_theta * self.width +
-                self._sin_theta * self.height)
+        return self._axis_aligned_dims()[0]
 
     @property
     def axis_aligned_height(self):
-        return (self._cos_theta * self.height +
-                self._sin_theta * self.width)
+        return self._axis_aligned_dims()[1]
 
 
 class Obround(Primitive):
     """
     """
 
+    __slots__ = ('_position', '_width', '_height', 'hole_diameter',
+                 'hole_width', 'hole_height', '_subshapes',
+                 '_axis_aligned_size')
+
+    _memoized = ('_subshapes', '_axis_aligned_size')
+
+    _to_convert = ('position', 'width', 'height', 'hole_diameter',
+                   'hole_width', 'hole_height')
+    _to_convert_getter = attrgetter(*_to_convert)
+
     def __init__(self, position, width, height, hole_diameter=0,
                  hole_width=0,hole_height=0, **kwargs):
         super(Obround, self).__init__(**kwargs)
-        validate_coordinates(position)
+        if __debug__:
+            validate_coordinates(position)
         self._position = position
         self._width = width
         self._height = height
         self.hole_diameter = hole_diameter
         self.hole_width = hole_width
         self.hole_height = hole_height
-        self._to_convert = ['position', 'width', 'height', 'hole_diameter',
-                            'hole_width', 'hole_height' ]
+        self._subshapes = None
+        self._axis_aligned_size = None
 
     @property
     def flashed(self):
@@ -1114,72 +1439,89 @@ class Obround(Primitive):
     @property
     def hole_radius(self):
         """The radius of the hole. If there is no hole, returns None"""
-        if self.hole_diameter != None:
+        if self.hole_diameter is not None:
             return self.hole_diameter / 2.
 
         return None
 
     @property
     def orientation(self):
-        return 'vertical' if self.height > self.width else 'horizontal'
+        return 'vertical' if self._height > self._width else 'horizontal'
 
     @property
     def bounding_box(self):
         if self._bounding_box is None:
-            ll = (self.position[0] - (self.axis_aligned_width / 2.),
-                  self.position[1] - (self.axis_aligned_height / 2.))
-            ur = (self.position[0] + (self.axis_aligned_width / 2.),
-                  self.position[1] + (self.axis_aligned_height / 2.))
-            self._bounding_box = ((ll[0], ur[0]), (ll[1], ur[1]))
+            x, y = self.position
+            aa_width, aa_height = self._axis_aligned_dims()
+            width_2 = aa_width / 2.
+            height_2 = aa_height / 2.
+            self._bounding_box = ((x - width_2, x + width_2),
+                                  (y - height_2, y + height_2))
         return self._bounding_box
 
     @property
     def subshapes(self):
-        if self.orientation == 'vertical':
-            circle1 = Circle((self.position[0], self.position[1] +
-                              (self.height - self.width) / 2.), self.width)
-            circle2 = Circle((self.position[0], self.position[1] -
-                              (self.height - self.width) / 2.), self.width)
-            rect = Rectangle(self.position, self.width,
-                             (self.height - self.width))
-        else:
-            circle1 = Circle((self.position[0]
-                              - (self.height - self.width) / 2.,
-                              self.position[1]), self.height)
-            circle2 = Circle((self.position[0]
-                              + (self.height - self.width) / 2.,
-                              self.position[1]), self.height)
-            rect = Rectangle(self.position, (self.width - self.height),
-                             self.height)
-        return {'circle1': circle1, 'circle2': circle2, 'rectangle': rect}
+        if self._subshapes is None:
+            position = self.position
+            x, y = position
+            width = self.width
+            height = self.height
+            offset = (height - width) / 2.
+            if height > width:
+                circle1 = Circle((x, y + offset), width)
+                circle2 = Circle((x, y - offset), width)
+                rect = Rectangle(position, width, height - width)
+            else:
+                circle1 = Circle((x - offset, y), height)
+                circle2 = Circle((x + offset, y), height)
+                rect = Rectangle(position, width - height, height)
+            self._subshapes = Subshapes(circle1, circle2, rect)
+        return self._subshapes
+
+    def offset(self, x_offset=0, y_offset=0):
+        if x_offset == 0 and y_offset == 0:
+            return
+        # Moving doesn't change the shape, so keep the cached size. Cached
+        # subshapes may already be held by a caller, so they are dropped and
+        # rebuilt at the new position rather than moved.
+        axis_aligned_size = self._axis_aligned_size
+        self._changed()
+        x, y = self._position
+        self._position = (x + x_offset, y + y_offset)
+        self._axis_aligned_size = axis_aligned_size
 
     @property
     def axis_aligned_width(self):
-        return (self._cos_theta * self.width +
-                self._sin_theta * self.height)
+        return self._axis_aligned_dims()[0]
 
     @property
     def axis_aligned_height(self):
-        return (self._cos_theta * self.height +
-                self._sin_theta * self.width)
+        return self._axis_aligned_dims()[1]
 
 
 class Polygon(Primitive):
     """
     Polygon flash defined by a set number of sides.
     """
+
+    __slots__ = ('_position', '_sides', '_radius', 'hole_diameter',
+                 'hole_width', 'hole_height')
+
+    _to_convert = ('position', 'radius', 'hole_diameter', 'hole_width',
+                   'hole_height')
+    _to_convert_getter = attrgetter(*_to_convert)
+
     def __init__(self, position, sides, radius, hole_diameter=0,
                  hole_width=0, hole_height=0, **kwargs):
         super(Polygon, self).__init__(**kwargs)
-        validate_coordinates(position)
+        if __debug__:
+            validate_coordinates(position)
         self._position = position
-        self.sides = sides
+        self._sides = sides
         self._radius = radius
         self.hole_diameter = hole_diameter
         self.hole_width = hole_width
         self.hole_height = hole_height
-        self._to_convert = ['position', 'radius', 'hole_diameter',
-                            'hole_width', 'hole_height']
 
     @property
     def flashed(self):
@@ -1191,7 +1533,7 @@ class Polygon(Primitive):
 
     @property
     def hole_radius(self):
-        if self.hole_diameter != None:
+        if self.hole_diameter is not None:
             return self.hole_diameter / 2.
         return None
 
@@ -1204,6 +1546,15 @@ class Polygon(Primitive):
         self._changed()
         self._position = value
 
+    @property
+    def sides(self):
+        return self._sides
+
+    @sides.setter
+    def sides(self, value):
+        self._changed()
+        self._sides = value
+
     @property
     def radius(self):
         return self._radius
@@ -1216,28 +1567,25 @@ class Polygon(Primitive):
     @property
     def bounding_box(self):
         if self._bounding_box is None:
-            min_x = self.position[0] - self.radius
-            max_x = self.position[0] + self.radius
-            min_y = self.position[1] - self.radius
-            max_y = self.position[1] + self.radius
-            self._bounding_box = ((min_x, max_x), (min_y, max_y))
+            x, y = self.position
+            radius = self.radius
+            self._bounding_box = ((x - radius, x + radius),
+                                  (y - radius, y + radius))
         return self._bounding_box
 
     def offset(self, x_offset=0, y_offset=0):
-        self.position = tuple(map(add, self.position, (x_offset, y_offset)))
+        x, y = self.position
+        self.position = (x + x_offset, y + y_offset)
 
     @property
     def vertices(self):
-
-        offset = self.rotation
-        delta_angle = 360.0 / self.sides
-
-        points = []
-        for i in range(self.sides):
-            points.append(
-                rotate_point((self.position[0] + self.radius, self.position[1]), offset + delta_angle * i, self.position))
-        return points
-
+        if self._vertices is None:
+            x, y = self.position
+            radius = self.radius
+            self._vertices = [(x + radius * cos_angle, y + radius * sin_angle)
+                              for cos_angle, sin_angle
+                              in _unit_polygon(self.sides, self.rotation)]
+        return self._vertices
 
     def equivalent(self, other, offset):
         """
@@ -1256,6 +1604,12 @@ class Polygon(Primitive):
 class AMGroup(Primitive):
     """
     """
+
+    __slots__ = ('primitives', '_position', 'stmt')
+
+    _to_convert = ('_position', 'primitives')
+    _to_convert_getter = attrgetter(*_to_convert)
+
     def __init__(self, amprimitives, stmt = None, **kwargs):
         """
 
@@ -1272,7 +1626,6 @@ class AMGroup(Primitive):
             elif prim:
                 self.primitives.append(prim)
         self._position = None
-        self._to_convert = ['_position', 'primitives']
         self.stmt = stmt
 
     def to_inch(self):
@@ -1298,22 +1651,21 @@ class AMGroup(Primitive):
 
     @property
     def bounding_box(self):
-        # TODO Make this cached like other items
-        xlims, ylims = zip(*[p.bounding_box for p in self.primitives])
-        minx, maxx = zip(*xlims)
-        miny, maxy = zip(*ylims)
-        min_x = min(minx)
-        max_x = max(maxx)
-        min_y = min(miny)
-        max_y = max(maxy)
-        return ((min_x, max_x), (min_y, max_y))
+        if self._bounding_box is None:
+            self._bounding_box = bounding_box_union(
+                p.bounding_box for p in self.primitives)
+        return self._bounding_box
 
     @property
     def position(self):
         return self._position
 
     def offset(self, x_offset=0, y_offset=0):
-        self._position = tuple(map(add, self._position, (x_offset, y_offset)))
+        if x_offset == 0 and y_offset == 0:
+            return
+        self._changed()
+        x, y = self._position
+        self._position = (x + x_offset, y + y_offset)
 
         for primitive in self.primitives:
             primitive.offset(x_offset, y_offset)
@@ -1332,8 +1684,11 @@ class AMGroup(Primitive):
             dx = new_pos[0]
             dy = new_pos[1]
 
-        for primitive in self.primitives:
-            primitive.offset(dx, dy)
+        # Only move (and invalidate) the children if the group really moves
+        if dx != 0 or dy != 0:
+            self._changed()
+            for primitive in self.primitives:
+                primitive.offset(dx, dy)
 
         self._position = new_pos
 
@@ -1342,16 +1697,14 @@ class AMGroup(Primitive):
         Is this the macro group the same as the other, ignoring the position offset?
         '''
 
-        if len(self.primitives) != len(other.primitives):
+        if (not isinstance(other, AMGroup) or
+                len(self.primitives) != len(other.primitives)):
             return False
 
-        # We know they have the same number of primitives, so now check them all
-        for i in range(0, len(self.primitives)):
-            if not self.primitives[i].equivalent(other.primitives[i], offset):
-                return False
-
-        # If we didn't find any differences, then they are the same
-        return True
+        # We know they have the same number of primitives, so now check them
+        # all, stopping at the first difference
+        return all(mine.equivalent(theirs, offset) for mine, theirs
+                   in zip(self.primitives, other.primitives))
 
 class Outline(Primitive):
     """
@@ -1359,10 +1712,14 @@ class Outline(Primitive):
     They don't exist outside of AMGroup objects
     """
 
+    __slots__ = ('primitives',)
+
+    _to_convert = ('primitives',)
+    _to_convert_getter = attrgetter(*_to_convert)
+
     def __init__(self, primitives, **kwargs):
         super(Outline, self).__init__(**kwargs)
         self.primitives = primitives
-        self._to_convert = ['primitives']
 
         if self.primitives[0].start != self.primitives[-1].end:
             raise ValueError('Outline must be closed')
@@ -1374,14 +1731,8 @@ class Outline(Primitive):
     @property
     def bounding_box(self):
         if self._bounding_box is None:
-            xlims, ylims = zip(*[p.bounding_box for p in self.primitives])
-            minx, maxx = zip(*xlims)
-            miny, maxy = zip(*ylims)
-            min_x = min(minx)
-            max_x = max(maxx)
-            min_y = min(miny)
-            max_y = max(maxy)
-            self._bounding_box = ((min_x, max_x), (min_y, max_y))
+            self._bounding_box = bounding_box_union(
+                p.bounding_box for p in self.primitives)
         return self._bounding_box
 
     def offset(self, x_offset=0, y_offset=0):
@@ -1415,20 +1766,21 @@ class Outline(Primitive):
         if type(self) != type(other) or len(self.primitives) != len(other.primitives):
             return False
 
-        for i in range(0, len(self.primitives)):
-            if not self.primitives[i].equivalent(other.primitives[i], offset):
-                return False
-
-        return True
+        return all(mine.equivalent(theirs, offset) for mine, theirs
+                   in zip(self.primitives, other.primitives))
 
 class Region(Primitive):
     """
     """
 
+    __slots__ = ('primitives',)
+
+    _to_convert = ('primitives',)
+    _to_convert_getter = attrgetter(*_to_convert)
+
     def __init__(self, primitives, **kwargs):
         super(Region, self).__init__(**kwargs)
         self.primitives = primitives
-        self._to_convert = ['primitives']
 
     @property
     def flashed(self):
@@ -1437,14 +1789,20 @@ class Region(Primitive):
     @property
     def bounding_box(self):
         if self._bounding_box is None:
-            xlims, ylims = zip(*[p.bounding_box_no_aperture for p in self.primitives])
-            minx, maxx = zip(*xlims)
-            miny, maxy = zip(*ylims)
-            min_x = min(minx)
-            max_x = max(maxx)
-            min_y = min(miny)
-            max_y = max(maxy)
-            self._bounding_box = ((min_x, max_x), (min_y, max_y))
+            x = []
+            y = []
+            for p in self.primitives:
+                if isinstance(p, Line):
+                    # A straight segment is bounded by its endpoints, so don't
+                    # build (and cache) a bounding box for every segment.
+                    (x0, y0), (x1, y1) = p.start, p.end
+                else:
+                    (x0, x1), (y0, y1) = p.bounding_box_no_aperture
+                x.append(x0)
+                x.append(x1)
+                y.append(y0)
+                y.append(y1)
+            self._bounding_box = ((min(x), max(x)), (min(y), max(y)))
         return self._bounding_box
 
     def offset(self, x_offset=0, y_offset=0):
@@ -1457,19 +1815,40 @@ class RoundButterfly(Primitive):
     """ A circle with two diagonally-opposite quadrants removed
     """
 
+    __slots__ = ('_position', '_diameter')
+
+    _to_convert = ('position', 'diameter')
+    _to_convert_getter = attrgetter(*_to_convert)
+
     def __init__(self, position, diameter, **kwargs):
         super(RoundButterfly, self).__init__(**kwargs)
-        validate_coordinates(position)
-        self.position = position
-        self.diameter = diameter
-        self._to_convert = ['position', 'diameter']
-
-        # TODO This does not reset bounding box correctly
+        if __debug__:
+            validate_coordinates(position)
+        self._position = position
+        self._diameter = diameter
 
     @property
     def flashed(self):
         return True
 
+    @property
+    def position(self):
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        self._changed()
+        self._position = value
+
+    @property
+    def diameter(self):
+        return self._diameter
+
+    @diameter.setter
+    def diameter(self, value):
+        self._changed()
+        self._diameter = value
+
     @property
     def radius(self):
         return self.diameter / 2.
@@ -1477,11 +1856,10 @@ class RoundButterfly(Primitive):
     @property
     def bounding_box(self):
         if self._bounding_box is None:
-            min_x = self.position[0] - self.radius
-            max_x = self.position[0] + self.radius
-            min_y = self.position[1] - self.radius
-            max_y = self.position[1] + self.radius
-            self._bounding_box = ((min_x, max_x), (min_y, max_y))
+            x, y = self.position
+            radius = self.radius
+            self._bounding_box = ((x - radius, x + radius),
+                                  (y - radius, y + radius))
         return self._bounding_box
 
 
@@ -1489,27 +1867,47 @@ class SquareButterfly(Primitive):
     """ A square with two diagonally-opposite quadrants removed
     """
 
+    __slots__ = ('_position', '_side')
+
+    _to_convert = ('position', 'side')
+    _to_convert_getter = attrgetter(*_to_convert)
+
     def __init__(self, position, side, **kwargs):
         super(SquareButterfly, self).__init__(**kwargs)
-        validate_coordinates(position)
-        self.position = position
-        self.side = side
-        self._to_convert = ['position', 'side']
-
-        # TODO This does not reset bounding box correctly
+        if __debug__:
+            validate_coordinates(position)
+        self._position = position
+        self._side = side
 
     @property
     def flashed(self):
         return True
 
+    @property
+    def position(self):
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        self._changed()
+        self._position = value
+
+    @property
+    def side(self):
+        return self._side
+
+    @side.setter
+    def side(self, value):
+        self._changed()
+        self._side = value
+
     @property
     def bounding_box(self):
         if self._bounding_box is None:
-            min_x = self.position[0] - (self.side / 2.)
-            max_x = self.position[0] + (self.side / 2.)
-            min_y = self.position[1] - (self.side / 2.)
-            max_y = self.position[1] + (self.side / 2.)
-            self._bounding_box = ((min_x, max_x), (min_y, max_y))
+            x, y = self.position
+            side_2 = self.side / 2.
+            self._bounding_box = ((x - side_2, x + side_2),
+                                  (y - side_2, y + side_2))
         return self._bounding_box
 
 
@@ -1517,11 +1915,19 @@ class Donut(Primitive):
     """ A Shape with an identical concentric shape removed from its center
     """
 
+    __slots__ = ('_position', 'shape', 'inner_diameter', 'outer_diameter',
+                 '_width', '_height')
+
+    _to_convert = ('position', 'width', 'height', 'inner_diameter',
+                   'outer_diameter')
+    _to_convert_getter = attrgetter(*_to_convert)
+
     def __init__(self, position, shape, inner_diameter,
                  outer_diameter, **kwargs):
         super(Donut, self).__init__(**kwargs)
-        validate_coordinates(position)
-        self.position = position
+        if __debug__:
+            validate_coordinates(position)
+        self._position = position
         if shape not in ('round', 'square', 'hexagon', 'octagon'):
             raise ValueError(
                 'Valid shapes are round, square, hexagon or octagon')
@@ -1532,40 +1938,63 @@ class Donut(Primitive):
         self.inner_diameter = inner_diameter
         self.outer_diameter = outer_diameter
         if self.shape in ('round', 'square', 'octagon'):
-            self.width = outer_diameter
-            self.height = outer_diameter
+            self._width = outer_diameter
+            self._height = outer_diameter
         else:
             # Hexagon
-            self.width = 0.5 * math.sqrt(3.) * outer_diameter
-            self.height = outer_diameter
+            self._width = 0.5 * math.sqrt(3.) * outer_diameter
+            self._height = outer_diameter
 
-        self._to_convert = ['position', 'width',
-                            'height', 'inner_diameter', 'outer_diameter']
-
-        # TODO This does not reset bounding box correctly
 
     @property
     def flashed(self):
         return True
 
+    @property
+    def position(self):
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        self._changed()
+        self._position = value
+
+    @property
+    def width(self):
+        return self._width
+
+    @width.setter
+    def width(self, value):
+        self._changed()
+        self._width = value
+
+    @property
+    def height(self):
+        return self._height
+
+    @height.setter
+    def height(self, value):
+        self._changed()
+        self._height = value
+
     @property
     def lower_left(self):
-        return (self.position[0] - (self.width / 2.),
-                self.position[1] - (self.height / 2.))
+        (min_x, _), (min_y, _) = self.bounding_box
+        return (min_x, min_y)
 
     @property
     def upper_right(self):
-        return (self.position[0] + (self.width / 2.),
-                self.position[1] + (self.height / 2.))
+        (_, max_x), (_, max_y) = self.bounding_box
+        return (max_x, max_y)
 
     @property
     def bounding_box(self):
         if self._bounding_box is None:
-            ll = (self.position[0] - (self.width / 2.),
-                  self.position[1] - (self.height / 2.))
-            ur = (self.position[0] + (self.width / 2.),
-                  self.position[1] + (self.height / 2.))
-            self._bounding_box = ((ll[0], ur[0]), (ll[1], ur[1]))
+            x, y = self._position
+            width_2 = self._width / 2.
+            height_2 = self._height / 2.
+            self._bounding_box = ((x - width_2, x + width_2),
+                                  (y - height_2, y + height_2))
         return self._bounding_box
 
 
@@ -1573,39 +2002,69 @@ class SquareRoundDonut(Primitive):
     """ A Square with a circular cutout in the center
     """
 
+    __slots__ = ('_position', 'inner_diameter', '_outer_diameter')
+
+    _to_convert = ('position', 'inner_diameter', 'outer_diameter')
+    _to_convert_getter = attrgetter(*_to_convert)
+
     def __init__(self, position, inner_diameter, outer_diameter, **kwargs):
         super(SquareRoundDonut, self).__init__(**kwargs)
-        validate_coordinates(position)
-        self.position = position
+        if __debug__:
+            validate_coordinates(position)
+        self._position = position
         if inner_diameter >= outer_diameter:
             raise ValueError(
                 'Outer diameter must be larger than inner diameter.')
         self.inner_diameter = inner_diameter
-        self.outer_diameter = outer_diameter
-        self._to_convert = ['position', 'inner_diameter', 'outer_diameter']
+        self._outer_diameter = outer_diameter
 
     @property
     def flashed(self):
         return True
 
+    @property
+    def position(self):
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        self._changed()
+        self._position = value
+
+    @property
+    def outer_diameter(self):
+        return self._outer_diameter
+
+    @outer_diameter.setter
+    def outer_diameter(self, value):
+        self._changed()
+        self._outer_diameter = value
+
     @property
     def bounding_box(self):
         if self._bounding_box is None:
-            ll = tuple([c - self.outer_diameter / 2. for c in self.position])
-            ur = tuple([c + self.outer_diameter / 2. for c in self.position])
-            self._bounding_box = ((ll[0], ur[0]), (ll[1], ur[1]))
+            x, y = self._position
+            radius = self._outer_diameter / 2.
+            self._bounding_box = ((x - radius, x + radius),
+                                  (y - radius, y + radius))
         return self._bounding_box
 
 
 class Drill(Primitive):
     """ A drill hole
     """
+
+    __slots__ = ('_position', '_diameter')
+
+    _to_convert = ('position', 'diameter')
+    _to_convert_getter = attrgetter(*_to_convert)
+
     def __init__(self, position, diameter, **kwargs):
         super(Drill, self).__init__('dark', **kwargs)
-        validate_coordinates(position)
+        if __debug__:
+            validate_coordinates(position)
         self._position = position
         self._diameter = diameter
-        self._to_convert = ['position', 'diameter']
 
     @property
     def flashed(self):
@@ -1636,16 +2095,16 @@ class Drill(Primitive):
     @property
     def bounding_box(self):
         if self._bounding_box is None:
-            min_x = self.position[0] - self.radius
-            max_x = self.position[0] + self.radius
-            min_y = self.position[1] - self.radius
-            max_y = self.position[1] + self.radius
-            self._bounding_box = ((min_x, max_x), (min_y, max_y))
+            x, y = self.position
+            radius = self.radius
+            self._bounding_box = ((x - radius, x + radius),
+                                  (y - radius, y + radius))
         return self._bounding_box
 
     def offset(self, x_offset=0, y_offset=0):
         self._changed()
-        self.position = tuple(map(add, self.position, (x_offset, y_offset)))
+        x, y = self._position
+        self._position = (x + x_offset, y + y_offset)
 
     def __str__(self):
         return '<Drill %f %s (%f, %f)>' % (self.diameter, self.units, self.position[0], self.position[1])
@@ -1654,44 +2113,82 @@ class Drill(Primitive):
 class Slot(Primitive):
     """ A drilled slot
     """
+
+    __slots__ = ('_start', '_end', '_diameter')
+
+    _to_convert = ('start', 'end', 'diameter')
+    _to_convert_getter = attrgetter(*_to_convert)
+
     def __init__(self, start, end, diameter, **kwargs):
         super(Slot, self).__init__('dark', **kwargs)
-        validate_coordinates(start)
-        validate_coordinates(end)
-        self.start = start
-        self.end = end
-        self.diameter = diameter
-        self._to_convert = ['start', 'end', 'diameter']
-
+        if __debug__:
+            validate_coordinates(start)
+            validate_coordinates(end)
+        self._start = start
+        self._end = end
+        self._diameter = diameter
 
     @property
     def flashed(self):
         return False
 
+    @property
+    def start(self):
+        return self._start
+
+    @start.setter
+    def start(self, value):
+        self._changed()
+        self._start = value
+
+    @property
+    def end(self):
+        return self._end
+
+    @end.setter
+    def end(self, value):
+        self._changed()
+        self._end = value
+
+    @property
+    def diameter(self):
+        return self._diameter
+
+    @diameter.setter
+    def diameter(self, value):
+        self._changed()
+        self._diameter = value
+
     @property
     def bounding_box(self):
         if self._bounding_box is None:
             radius = self.diameter / 2.
-            min_x = min(self.start[0], self.end[0]) - radius
-            max_x = max(self.start[0], self.end[0]) + radius
-            min_y = min(self.start[1], self.end[1]) - radius
-            max_y = max(self.start[1], self.end[1]) + radius
-            self._bounding_box = ((min_x, max_x), (min_y, max_y))
+            min_x, max_x, min_y, max_y = _segment_extents(self.start, self.end)
+            self._bounding_box = ((min_x - radius, max_x + radius),
+                                  (min_y - radius, max_y + radius))
         return self._bounding_box
 
     def offset(self, x_offset=0, y_offset=0):
-        self.start = tuple(map(add, self.start, (x_offset, y_offset)))
-        self.end = tuple(map(add, self.end, (x_offset, y_offset)))
+        self._changed()
+        start_x, start_y = self._start
+        end_x, end_y = self._end
+        self._start = (start_x + x_offset, start_y + y_offset)
+        self._end = (end_x + x_offset, end_y + y_offset)
 
 
 class TestRecord(Primitive):
     """ Netlist Test record
     """
 
+    __slots__ = ('position', 'layer')
+
+    _to_convert = ('position',)
+    _to_convert_getter = attrgetter(*_to_convert)
+
     def __init__(self, position, net_name, layer, **kwargs):
         super(TestRecord, self).__init__(**kwargs)
-        validate_coordinates(position)
+        if __debug__:
+            validate_coordinates(position)
         self.position = position
         self.net_name = net_name
         self.layer = layer
-        self._to_convert = ['position']
@@ -21,18 +21,28 @@ try:
 except ImportError:
     import cairocffi as cairo
 
-from operator import mul
 import tempfile
 import copy
+import math
 import os
+import shutil
 
 from .render import GerberContext, RenderSettings
 from .theme import THEMES
 from ..primitives import *
-from ..utils import rotate_point
+from ..utils import bounding_box_union, rotate_point
 
 from io import BytesIO
 
+_TAU = 2.0 * math.pi
+
+
+def _is_svg(filename):
+    try:
+        return os.path.splitext(filename.lower())[1] == '.svg'
+    except (AttributeError, TypeError):
+        return False
+
 
 class GerberCairoContext(GerberContext):
 
@@ -50,6 +60,14 @@ class GerberCairoContext(GerberContext):
         self.size_in_inch = None
         self._xform_matrix = None
         self._render_count = 0
+        # Pixel origin and size of the layer being rendered, fixed for the
+        # duration of the layer and read by every mask and clip
+        self._layer_origin = None
+        self._layer_size = None
+        self._operator = None
+        # Stroke runs of matching round-aperture traces together, see
+        # _render_traces()
+        self.batch_traces = True
 
     @property
     def origin_in_pixels(self):
@@ -61,7 +79,7 @@ class GerberCairoContext(GerberContext):
         return (self.scale_point(self.size_in_inch)
                 if self.size_in_inch is not None else (0.0, 0.0))
 
-    def set_bounds(self, bounds, new_surface=False):
+    def set_bounds(self, bounds, new_surface=False, svg=True):
         origin_in_inch = (bounds[0][0], bounds[1][0])
         size_in_inch = (abs(bounds[0][1] - bounds[0][0]),
                         abs(bounds[1][1] - bounds[1][0]))
@@ -72,12 +90,19 @@ class GerberCairoContext(GerberContext):
                                           x0=-self.origin_in_pixels[0],
                                           y0=self.size_in_pixels[1])
         if (self.surface is None) or new_surface:
-            self.surface_buffer = tempfile.NamedTemporaryFile()
-            self.surface = cairo.SVGSurface(self.surface_buffer, size_in_pixels[0], size_in_pixels[1])
+            if svg:
+                self.surface_buffer = tempfile.NamedTemporaryFile()
+                self.surface = cairo.SVGSurface(self.surface_buffer, size_in_pixels[0], size_in_pixels[1])
+            else:
+                # Raster output only, so draw straight into an image surface
+                self.surface_buffer = None
+                self.surface = cairo.ImageSurface(cairo.FORMAT_ARGB32,
+                                                  int(math.ceil(size_in_pixels[0])),
+                                                  int(math.ceil(size_in_pixels[1])))
             self.output_ctx = cairo.Context(self.surface)
 
     def render_layer(self, layer, filename=None, settings=None, bgsettings=None,
-                     verbose=False, bounds=None):
+                     verbose=False, bounds=None, svg=True):
         if settings is None:
             settings = THEMES['default'].get(layer.layer_class, RenderSettings())
         if bgsettings is None:
@@ -88,9 +113,9 @@ class GerberCairoContext(GerberContext):
                 print('[Render]: Rendering Background.')
             self.clear()
             if bounds is not None:
-                self.set_bounds(bounds)
+                self.set_bounds(bounds, svg=svg)
             else:
-                self.set_bounds(layer.bounds)
+                self.set_bounds(layer.bounds, svg=svg)
             self.paint_background(bgsettings)
         if verbose:
             print('[Render]: Rendering {} Layer.'.format(layer.layer_class))
@@ -106,8 +131,10 @@ class GerberCairoContext(GerberContext):
         # Calculate scale parameter
         x_range = [10000, -10000]
         y_range = [10000, -10000]
-        for layer in layers:
-            bounds = layer.bounds
+        # Layer bounds are computed from the file on every access, so they
+        # are looked up once here and handed on to render_layer()
+        layer_bounds = [layer.bounds for layer in layers]
+        for bounds in layer_bounds:
             if bounds is not None:
                 layer_x, layer_y = bounds
                 x_range[0] = min(x_range[0], layer_x[0])
@@ -122,30 +149,27 @@ class GerberCairoContext(GerberContext):
 
         self.clear()
 
-        # Render layers
+        # Render layers, straight into an image surface unless the output
+        # is SVG
+        svg = _is_svg(filename)
         bgsettings = theme['background']
-        for layer in layers:
+        for layer, bounds in zip(layers, layer_bounds):
             settings = theme.get(layer.layer_class, RenderSettings())
             self.render_layer(layer, settings=settings, bgsettings=bgsettings,
-                              verbose=verbose)
+                              verbose=verbose, bounds=bounds, svg=svg)
         self.dump(filename, verbose)
 
     def dump(self, filename=None, verbose=False):
         """ Save image as `filename`
         """
-        try:
-            is_svg = os.path.splitext(filename.lower())[1] == '.svg'
-        except:
-            is_svg = False
         if verbose:
             print('[Render]: Writing image to {}'.format(filename))
-        if is_svg:
+        if _is_svg(filename):
             self.surface.finish()
             self.surface_buffer.flush()
             with open(filename, "wb") as f:
                 self.surface_buffer.seek(0)
-                f.write(self.surface_buffer.read())
-                f.flush()
+                shutil.copyfileobj(self.surface_buffer, f, 1 << 16)
         else:
             return self.surface.write_to_png(filename)
 
@@ -173,14 +197,23 @@ class GerberCairoContext(GerberContext):
         self._render_count = 0
         self.surface_buffer = None
 
+    def _new_surface(self, size_in_pixels):
+        """ Create an intermediate surface for a layer or mask
+
+        Recording surfaces keep the drawing operations and replay them when
+        composited, avoiding the SVG serialisation of an SVGSurface.
+        """
+        return cairo.RecordingSurface(cairo.CONTENT_COLOR_ALPHA,
+                                      (0, 0, size_in_pixels[0],
+                                       size_in_pixels[1]))
+
     def _new_mask(self):
         class Mask:
             def __enter__(msk):
-                size_in_pixels = self.size_in_pixels
-                msk.surface = cairo.SVGSurface(None, size_in_pixels[0],
-                                               size_in_pixels[1])
+                origin = self._layer_origin
+                msk.surface = self._new_surface(self._layer_size)
                 msk.ctx = cairo.Context(msk.surface)
-                msk.ctx.translate(-self.origin_in_pixels[0], -self.origin_in_pixels[1])
+                msk.ctx.translate(-origin[0], -origin[1])
                 return msk
 
 
@@ -190,50 +223,142 @@ class GerberCairoContext(GerberContext):
 
         return Mask()
 
+    def _set_style(self, level_polarity):
+        """ Set the layer compositing operator for a primitive's polarity
+
+        The operator is only changed on the context when it differs from
+        the one last set on the current layer.
+        """
+        operator = (cairo.OPERATOR_OVER
+                    if (not self.invert) and level_polarity == 'dark'
+                    else cairo.OPERATOR_CLEAR)
+        if operator != self._operator:
+            self.ctx.set_operator(operator)
+            self._operator = operator
+
     def _render_layer(self, layer, settings):
         self.invert = settings.invert
         # Get a new clean layer to render on
         self.new_render_layer(mirror=settings.mirror)
+        # Primitives entirely outside the image are skipped
+        x_min, y_min = self.origin_in_inch
+        x_max = x_min + self.size_in_inch[0]
+        y_max = y_min + self.size_in_inch[1]
+        # Consecutive round-aperture traces of the same width and polarity
+        # are collected and stroked together
+        traces = []
+        render = self.render
+        render_traces = self._render_traces
+        batch_traces = self.batch_traces
         for prim in layer.primitives:
-            self.render(prim)
+            if not isinstance(prim, TestRecord):
+                try:
+                    bounding_box = prim.bounding_box
+                except ValueError:
+                    # Nothing to draw, e.g. an aperture macro whose only
+                    # primitives (such as moire) produce no shapes
+                    continue
+                (prim_x_min, prim_x_max), (prim_y_min, prim_y_max) = bounding_box
+                if (prim_x_max < x_min or prim_x_min > x_max
+                        or prim_y_max < y_min or prim_y_min > y_max):
+                    continue
+            if (batch_traces and type(prim) is Line
+                    and isinstance(prim.aperture, Circle)):
+                if traces and (prim.aperture.diameter != traces[0].aperture.diameter
+                               or prim.level_polarity != traces[0].level_polarity):
+                    render_traces(traces)
+                    traces = []
+                traces.append(prim)
+                continue
+            if traces:
+                render_traces(traces)
+                traces = []
+            render(prim)
+        if traces:
+            render_traces(traces)
         # Add layer to image
         self.flatten(settings.color, settings.alpha)
 
     def _render_line(self, line, color):
-        start = self.scale_point(line.start)
-        end = self.scale_point(line.end)
-        self.ctx.set_operator(cairo.OPERATOR_OVER
-                              if (not self.invert)
-                                 and line.level_polarity == 'dark'
-                              else cairo.OPERATOR_CLEAR)
+        sx, sy = self.scale
+        start = line.start
+        start = (start[0] * sx, start[1] * sy)
+        end = line.end
+        end = (end[0] * sx, end[1] * sy)
+        self._set_style(line.level_polarity)
 
         with self._clip_primitive(line):
             with self._new_mask() as mask:
-                if isinstance(line.aperture, Circle):
-                    width = line.aperture.diameter
-                    mask.ctx.set_line_width(width * self.scale[0])
+                aperture = line.aperture
+                vertices = line.vertices
+                if isinstance(aperture, Circle):
+                    mask.ctx.set_line_width(aperture.diameter * sx)
                     mask.ctx.set_line_cap(cairo.LINE_CAP_ROUND)
                     mask.ctx.move_to(*start)
                     mask.ctx.line_to(*end)
                     mask.ctx.stroke()
 
-                elif hasattr(line, 'vertices') and line.vertices is not None:
-                    points = [self.scale_point(x) for x in line.vertices]
+                elif vertices is not None:
+                    points = [(x * sx, y * sy) for x, y in vertices]
+                    line_to = mask.ctx.line_to
                     mask.ctx.set_line_width(0)
                     mask.ctx.move_to(*points[-1])
-                    for point in points:
-                        mask.ctx.line_to(*point)
+                    for x, y in points:
+                        line_to(x, y)
                     mask.ctx.fill()
-                self.ctx.mask_surface(mask.surface, self.origin_in_pixels[0])
+                self.ctx.mask_surface(mask.surface, self._layer_origin[0])
+
+    def _render_traces(self, lines):
+        """ Stroke a run of round-aperture lines as a single path
+
+        All lines must share the aperture diameter and level polarity, so
+        the operator is set once through _set_style() exactly as render()
+        would set it for each line, and the pre/post render hooks are
+        called for every line around the stroke. Drawing order only matters
+        between polarities, and runs never span a polarity change.
+
+        Where traces in a run overlap, the overlap is anti-aliased once for
+        the combined outline instead of once per trace, so edge pixels at
+        crossings can differ slightly from unbatched output. Set
+        `batch_traces` to False to render each line separately.
+        """
+        if len(lines) == 1:
+            self.render(lines[0])
+            return
+        first = lines[0]
+        sx, sy = self.scale
+        for line in lines:
+            self.pre_render_primitive(line)
+        self._set_style(first.level_polarity)
+        bounds = bounding_box_union(line.bounding_box for line in lines)
+        with self._clip_bounds(bounds):
+            with self._new_mask() as mask:
+                ctx = mask.ctx
+                move_to = ctx.move_to
+                line_to = ctx.line_to
+                ctx.set_line_width(first.aperture.diameter * sx)
+                ctx.set_line_cap(cairo.LINE_CAP_ROUND)
+                for line in lines:
+                    start = line.start
+                    end = line.end
+                    move_to(start[0] * sx, start[1] * sy)
+                    line_to(end[0] * sx, end[1] * sy)
+                ctx.stroke()
+                self.ctx.mask_surface(mask.surface, self._layer_origin[0])
+        for line in lines:
+            self.post_render_primitive(line)
 
     def _render_arc(self, arc, color):
-        center = self.scale_point(arc.center)
-        start = self.scale_point(arc.start)
-        end = self.scale_point(arc.end)
-        radius = self.scale[0] * arc.radius
-        two_pi = 2 * math.pi
-        angle1 = (arc.start_angle + two_pi) % two_pi
-        angle2 = (arc.end_angle + two_pi) % two_pi
+        sx, sy = self.scale
+        center = arc.center
+        center = (center[0] * sx, center[1] * sy)
+        start = arc.start
+        start = (start[0] * sx, start[1] * sy)
+        end = arc.end
+        end = (end[0] * sx, end[1] * sy)
+        radius = sx * arc.radius
+        angle1 = (arc.start_angle + _TAU) % _TAU
+        angle2 = (arc.end_angle + _TAU) % _TAU
         if angle1 == angle2 and arc.quadrant_mode != 'single-quadrant':
             # Make the angles slightly different otherwise Cario will draw nothing
             angle2 -= 0.000000001
@@ -242,22 +367,28 @@ class GerberCairoContext(GerberContext):
         else:
             width = max(arc.aperture.width, arc.aperture.height, 0.001)
 
-        self.ctx.set_operator(cairo.OPERATOR_OVER
-                              if (not self.invert)
-                                 and arc.level_polarity == 'dark'
-                              else cairo.OPERATOR_CLEAR)
+        self._set_style(arc.level_polarity)
         with self._clip_primitive(arc):
             with self._new_mask() as mask:
-                mask.ctx.set_line_width(width * self.scale[0])
-                mask.ctx.set_line_cap(cairo.LINE_CAP_ROUND if isinstance(arc.aperture, Circle) else cairo.LINE_CAP_SQUARE)
-                mask.ctx.move_to(*start)  # You actually have to do this...
+                if arc.radius * sx < 0.25 and width * sx < 1.0:
+                    # The whole arc fits inside a pixel (both tests are in
+                    # pixels), so a dot the width of the stroke covers the
+                    # same pixels without stroking a path
+                    mask.ctx.arc(center[0], center[1], width * sx / 2., 0, _TAU)
+                    mask.ctx.fill()
+                    self.ctx.mask_surface(mask.surface, self._layer_origin[0])
+                    return
+                ctx = mask.ctx
+                ctx.set_line_width(width * sx)
+                ctx.set_line_cap(cairo.LINE_CAP_ROUND if isinstance(arc.aperture, Circle) else cairo.LINE_CAP_SQUARE)
+                ctx.move_to(*start)  # You actually have to do this...
                 if arc.direction == 'counterclockwise':
-                    mask.ctx.arc(center[0], center[1], radius, angle1, angle2)
+                    ctx.arc(center[0], center[1], radius, angle1, angle2)
                 else:
-                    mask.ctx.arc_negative(center[0], center[1], radius,
-                                          angle1, angle2)
-                mask.ctx.move_to(*end)  # ...lame
-                mask.ctx.stroke()
+                    ctx.arc_negative(center[0], center[1], radius,
+                                     angle1, angle2)
+                ctx.move_to(*end)  # ...lame
+                ctx.stroke()
 
                 #if isinstance(arc.aperture, Rectangle):
                 #    print("Flash Rectangle Ends")
@@ -271,49 +402,53 @@ class GerberCairoContext(GerberContext):
                 #                           point[1] - height/2.0, width, height)
                 #        mask.ctx.fill()
 
-                self.ctx.mask_surface(mask.surface, self.origin_in_pixels[0])
+                self.ctx.mask_surface(mask.surface, self._layer_origin[0])
 
     def _render_region(self, region, color):
-        self.ctx.set_operator(cairo.OPERATOR_OVER
-                              if (not self.invert) and region.level_polarity == 'dark'
-                              else cairo.OPERATOR_CLEAR)
+        self._set_style(region.level_polarity)
         with self._clip_primitive(region):
             with self._new_mask() as mask:
-                mask.ctx.set_line_width(0)
-                mask.ctx.set_line_cap(cairo.LINE_CAP_ROUND)
-                mask.ctx.move_to(*self.scale_point(region.primitives[0].start))
+                ctx = mask.ctx
+                line_to = ctx.line_to
+                arc = ctx.arc
+                arc_negative = ctx.arc_negative
+                sx, sy = self.scale
+                ctx.set_line_width(0)
+                ctx.set_line_cap(cairo.LINE_CAP_ROUND)
+                start = region.primitives[0].start
+                ctx.move_to(start[0] * sx, start[1] * sy)
                 for prim in region.primitives:
                     if isinstance(prim, Line):
-                        mask.ctx.line_to(*self.scale_point(prim.end))
+                        end = prim.end
+                        line_to(end[0] * sx, end[1] * sy)
                     else:
-                        center = self.scale_point(prim.center)
-                        radius = self.scale[0] * prim.radius
+                        center = prim.center
+                        radius = sx * prim.radius
                         angle1 = prim.start_angle
                         angle2 = prim.end_angle
                         if prim.direction == 'counterclockwise':
-                            mask.ctx.arc(center[0], center[1], radius,
-                                         angle1, angle2)
+                            arc(center[0] * sx, center[1] * sy, radius,
+                                angle1, angle2)
                         else:
-                            mask.ctx.arc_negative(center[0], center[1], radius,
-                                                  angle1, angle2)
-                mask.ctx.fill()
-                self.ctx.mask_surface(mask.surface, self.origin_in_pixels[0])
+                            arc_negative(center[0] * sx, center[1] * sy,
+                                         radius, angle1, angle2)
+                ctx.fill()
+                self.ctx.mask_surface(mask.surface, self._layer_origin[0])
 
     def _render_circle(self, circle, color):
-        center = self.scale_point(circle.position)
-        self.ctx.set_operator(cairo.OPERATOR_OVER
-                              if (not self.invert)
-                                 and circle.level_polarity == 'dark'
-                              else cairo.OPERATOR_CLEAR)
+        sx, sy = self.scale
+        center = circle.position
+        center = (center[0] * sx, center[1] * sy)
+        self._set_style(circle.level_polarity)
         with self._clip_primitive(circle):
             with self._new_mask() as mask:
                 mask.ctx.set_line_width(0)
-                mask.ctx.arc(center[0], center[1], (circle.radius * self.scale[0]), 0, (2 * math.pi))
+                mask.ctx.arc(center[0], center[1], (circle.radius * sx), 0, _TAU)
                 mask.ctx.fill()
 
                 if hasattr(circle, 'hole_diameter') and circle.hole_diameter is not None and circle.hole_diameter > 0:
                     mask.ctx.set_operator(cairo.OPERATOR_CLEAR)
-                    mask.ctx.arc(center[0], center[1], circle.hole_radius * self.scale[0], 0, 2 * math.pi)
+                    mask.ctx.arc(center[0], center[1], circle.hole_radius * sx, 0, _TAU)
                     mask.ctx.fill()
 
                 if (hasattr(circle, 'hole_width') and hasattr(circle, 'hole_height')
@@ -323,7 +458,7 @@ class GerberCairoContext(GerberContext):
                                           if circle.level_polarity == 'dark'
                                              and (not self.invert)
                                           else cairo.OPERATOR_OVER)
-                    width, height = self.scale_point((circle.hole_width, circle.hole_height))
+                    width, height = circle.hole_width * sx, circle.hole_height * sy
                     lower_left = rotate_point(
                         (center[0] - width / 2.0, center[1] - height / 2.0),
                                               circle.rotation, center)
@@ -338,24 +473,23 @@ class GerberCairoContext(GerberContext):
                     for point in points:
                         mask.ctx.line_to(*point)
                     mask.ctx.fill()
-                self.ctx.mask_surface(mask.surface, self.origin_in_pixels[0])
+                self.ctx.mask_surface(mask.surface, self._layer_origin[0])
 
     def _render_rectangle(self, rectangle, color):
-        lower_left = self.scale_point(rectangle.lower_left)
-        width, height = tuple([abs(coord) for coord in
-                               self.scale_point((rectangle.width,
-                                                 rectangle.height))])
-        self.ctx.set_operator(cairo.OPERATOR_OVER
-                              if (not self.invert)
-                                 and rectangle.level_polarity == 'dark'
-                              else cairo.OPERATOR_CLEAR)
+        sx, sy = self.scale
+        lower_left = rectangle.lower_left
+        lower_left = (lower_left[0] * sx, lower_left[1] * sy)
+        width = abs(rectangle.width * sx)
+        height = abs(rectangle.height * sy)
+        self._set_style(rectangle.level_polarity)
         with self._clip_primitive(rectangle):
             with self._new_mask() as mask:
                 mask.ctx.set_line_width(0)
                 mask.ctx.rectangle(lower_left[0], lower_left[1], width, height)
                 mask.ctx.fill()
 
-                center = self.scale_point(rectangle.position)
+                center = rectangle.position
+                center = (center[0] * sx, center[1] * sy)
                 if rectangle.hole_diameter > 0:
                     # Render the center clear
                     mask.ctx.set_operator(cairo.OPERATOR_CLEAR
@@ -363,7 +497,7 @@ class GerberCairoContext(GerberContext):
                                              and (not self.invert)
                                           else cairo.OPERATOR_OVER)
 
-                    mask.ctx.arc(center[0], center[1], rectangle.hole_radius * self.scale[0], 0, 2 * math.pi)
+                    mask.ctx.arc(center[0], center[1], rectangle.hole_radius * sx, 0, _TAU)
                     mask.ctx.fill()
 
                 if rectangle.hole_width > 0 and rectangle.hole_height > 0:
@@ -371,7 +505,7 @@ class GerberCairoContext(GerberContext):
                                           if rectangle.level_polarity == 'dark'
                                              and (not self.invert)
                                           else cairo.OPERATOR_OVER)
-                    width, height = self.scale_point((rectangle.hole_width, rectangle.hole_height))
+                    width, height = rectangle.hole_width * sx, rectangle.hole_height * sy
                     lower_left = rotate_point((center[0] - width/2.0, center[1] - height/2.0), rectangle.rotation, center)
                     lower_right = rotate_point((center[0] + width/2.0, center[1] - height/2.0), rectangle.rotation, center)
                     upper_left = rotate_point((center[0] - width / 2.0, center[1] + height / 2.0), rectangle.rotation, center)
@@ -381,45 +515,46 @@ class GerberCairoContext(GerberContext):
                     for point in points:
                         mask.ctx.line_to(*point)
                     mask.ctx.fill()
-                self.ctx.mask_surface(mask.surface, self.origin_in_pixels[0])
+                self.ctx.mask_surface(mask.surface, self._layer_origin[0])
 
     def _render_obround(self, obround, color):
-        self.ctx.set_operator(cairo.OPERATOR_OVER
-                              if (not self.invert)
-                                 and obround.level_polarity == 'dark'
-                              else cairo.OPERATOR_CLEAR)
+        self._set_style(obround.level_polarity)
         with self._clip_primitive(obround):
             with self._new_mask() as mask:
                 mask.ctx.set_line_width(0)
 
-                # Render circles
-                for circle in (obround.subshapes['circle1'], obround.subshapes['circle2']):
-                    center = self.scale_point(circle.position)
-                    mask.ctx.arc(center[0], center[1], (circle.radius * self.scale[0]), 0, (2 * math.pi))
-                    mask.ctx.fill()
-
-                # Render Rectangle
-                rectangle = obround.subshapes['rectangle']
-                lower_left = self.scale_point(rectangle.lower_left)
-                width, height = tuple([abs(coord) for coord in
-                                       self.scale_point((rectangle.width,
-                                                         rectangle.height))])
-                mask.ctx.rectangle(lower_left[0], lower_left[1], width, height)
+                # Outline the stadium as two semicircular caps joined by
+                # straight sides, and fill it once
+                sx, sy = self.scale
+                center = obround.position
+                center = (center[0] * sx, center[1] * sy)
+                if obround.height > obround.width:
+                    radius = obround.width / 2. * sx
+                    offset = (obround.height - obround.width) / 2. * sy
+                    mask.ctx.arc(center[0], center[1] + offset, radius, 0, math.pi)
+                    mask.ctx.arc(center[0], center[1] - offset, radius, math.pi, _TAU)
+                else:
+                    radius = obround.height / 2. * sy
+                    offset = (obround.width - obround.height) / 2. * sx
+                    mask.ctx.arc(center[0] + offset, center[1], radius,
+                                 -math.pi / 2., math.pi / 2.)
+                    mask.ctx.arc(center[0] - offset, center[1], radius,
+                                 math.pi / 2., 3. * math.pi / 2.)
+                mask.ctx.close_path()
                 mask.ctx.fill()
 
-                center = self.scale_point(obround.position)
                 if obround.hole_diameter > 0:
                     # Render the center clear
                     mask.ctx.set_operator(cairo.OPERATOR_CLEAR)
-                    mask.ctx.arc(center[0], center[1], obround.hole_radius * self.scale[0], 0, 2 * math.pi)
+                    mask.ctx.arc(center[0], center[1], obround.hole_radius * sx, 0, _TAU)
                     mask.ctx.fill()
 
                 if obround.hole_width > 0 and obround.hole_height > 0:
                     mask.ctx.set_operator(cairo.OPERATOR_CLEAR
-                                          if rectangle.level_polarity == 'dark'
+                                          if obround.level_polarity == 'dark'
                                              and (not self.invert)
                                           else cairo.OPERATOR_OVER)
-                    width, height =self.scale_point((obround.hole_width, obround.hole_height))
+                    width, height = obround.hole_width * sx, obround.hole_height * sy
                     lower_left = rotate_point((center[0] - width / 2.0, center[1] - height / 2.0),
                                               obround.rotation, center)
                     lower_right = rotate_point((center[0] + width / 2.0, center[1] - height / 2.0),
@@ -434,27 +569,26 @@ class GerberCairoContext(GerberContext):
                         mask.ctx.line_to(*point)
                     mask.ctx.fill()
 
-                self.ctx.mask_surface(mask.surface, self.origin_in_pixels[0])
+                self.ctx.mask_surface(mask.surface, self._layer_origin[0])
 
     def _render_polygon(self, polygon, color):
-        self.ctx.set_operator(cairo.OPERATOR_OVER
-                              if (not self.invert)
-                                 and polygon.level_polarity == 'dark'
-                              else cairo.OPERATOR_CLEAR)
+        self._set_style(polygon.level_polarity)
         with self._clip_primitive(polygon):
             with self._new_mask() as mask:
 
-                vertices = polygon.vertices
+                sx, sy = self.scale
+                vertices = [(x * sx, y * sy) for x, y in polygon.vertices]
+                line_to = mask.ctx.line_to
                 mask.ctx.set_line_width(0)
                 mask.ctx.set_line_cap(cairo.LINE_CAP_ROUND)
                 # Start from before the end so it is easy to iterate and make sure
                 # it is closed
-                mask.ctx.move_to(*self.scale_point(vertices[-1]))
-                for v in vertices:
-                    mask.ctx.line_to(*self.scale_point(v))
+                mask.ctx.move_to(*vertices[-1])
+                for x, y in vertices:
+                    line_to(x, y)
                 mask.ctx.fill()
 
-                center = self.scale_point(polygon.position)
+                center = (polygon.position[0] * sx, polygon.position[1] * sy)
                 if polygon.hole_radius > 0:
                     # Render the center clear
                     mask.ctx.set_operator(cairo.OPERATOR_CLEAR
@@ -464,7 +598,7 @@ class GerberCairoContext(GerberContext):
                     mask.ctx.set_line_width(0)
                     mask.ctx.arc(center[0],
                                  center[1],
-                                 polygon.hole_radius * self.scale[0], 0, 2 * math.pi)
+                                 polygon.hole_radius * sx, 0, _TAU)
                     mask.ctx.fill()
 
                 if polygon.hole_width > 0 and polygon.hole_height > 0:
@@ -472,7 +606,7 @@ class GerberCairoContext(GerberContext):
                                           if polygon.level_polarity == 'dark'
                                              and (not self.invert)
                                           else cairo.OPERATOR_OVER)
-                    width, height = self.scale_point((polygon.hole_width, polygon.hole_height))
+                    width, height = polygon.hole_width * sx, polygon.hole_height * sy
                     lower_left = rotate_point((center[0] - width / 2.0, center[1] - height / 2.0),
                                               polygon.rotation, center)
                     lower_right = rotate_point((center[0] + width / 2.0, center[1] - height / 2.0),
@@ -487,29 +621,28 @@ class GerberCairoContext(GerberContext):
                         mask.ctx.line_to(*point)
                     mask.ctx.fill()
 
-                self.ctx.mask_surface(mask.surface, self.origin_in_pixels[0])
+                self.ctx.mask_surface(mask.surface, self._layer_origin[0])
 
     def _render_drill(self, circle, color=None):
         color = color if color is not None else self.drill_color
         self._render_circle(circle, color)
 
     def _render_slot(self, slot, color):
-        start = map(mul, slot.start, self.scale)
-        end = map(mul, slot.end, self.scale)
+        sx, sy = self.scale
+        start = (slot.start[0] * sx, slot.start[1] * sy)
+        end = (slot.end[0] * sx, slot.end[1] * sy)
 
         width = slot.diameter
 
-        self.ctx.set_operator(cairo.OPERATOR_OVER
-                              if slot.level_polarity == 'dark' and
-                                 (not self.invert) else cairo.OPERATOR_CLEAR)
+        self._set_style(slot.level_polarity)
         with self._clip_primitive(slot):
             with self._new_mask() as mask:
-                mask.ctx.set_line_width(width * self.scale[0])
+                mask.ctx.set_line_width(width * sx)
                 mask.ctx.set_line_cap(cairo.LINE_CAP_ROUND)
                 mask.ctx.move_to(*start)
                 mask.ctx.line_to(*end)
                 mask.ctx.stroke()
-                self.ctx.mask_surface(mask.surface, self.origin_in_pixels[0])
+                self.ctx.mask_surface(mask.surface, self._layer_origin[0])
 
     def _render_amgroup(self, amgroup, color):
         for primitive in amgroup.primitives:
@@ -522,9 +655,7 @@ class GerberCairoContext(GerberContext):
             'monospace', cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
         self.ctx.set_font_size(13)
         self._render_circle(Circle(position, 0.015), color)
-        self.ctx.set_operator(cairo.OPERATOR_OVER
-                              if primitive.level_polarity == 'dark' and
-                              (not self.invert) else cairo.OPERATOR_CLEAR)
+        self._set_style(primitive.level_polarity)
         self.ctx.move_to(*[self.scale[0] * (coord + 0.015) for coord in position])
         self.ctx.scale(1, -1)
         self.ctx.show_text(primitive.net_name)
@@ -532,19 +663,25 @@ class GerberCairoContext(GerberContext):
 
     def new_render_layer(self, color=None, mirror=False):
         size_in_pixels = self.scale_point(self.size_in_inch)
-        matrix = copy.copy(self._xform_matrix)
-        layer = cairo.SVGSurface(None, size_in_pixels[0], size_in_pixels[1])
+        # The shared transform is only copied when it has to be modified;
+        # set_matrix() copies the values into the context anyway.
+        matrix = self._xform_matrix
+        layer = self._new_surface(size_in_pixels)
         ctx = cairo.Context(layer)
 
         if self.invert:
             ctx.set_source_rgba(0.0, 0.0, 0.0, 1.0)
             ctx.set_operator(cairo.OPERATOR_OVER)
             ctx.paint()
+        self._layer_origin = self.origin_in_pixels
+        self._layer_size = size_in_pixels
         if mirror:
+            matrix = copy.copy(matrix)
             matrix.xx = -1.0
-            matrix.x0 = self.origin_in_pixels[0] + self.size_in_pixels[0]
+            matrix.x0 = self._layer_origin[0] + size_in_pixels[0]
         self.ctx = ctx
         self.ctx.set_matrix(matrix)
+        self._operator = None
         self.active_layer = layer
         self.active_matrix = matrix
 
@@ -579,10 +716,18 @@ class GerberCairoContext(GerberContext):
         The context manager will reset the context's clipping region when it
         goes out of scope.
 
+        """
+        return self._clip_bounds(primitive.bounding_box)
+
+    def _clip_bounds(self, bounding_box):
+        """ Clip rendering context to a pixel-aligned bounding box
+
+        Same as :meth:`_clip_primitive`, for a bounding box given as
+        ((x_min, x_max), (y_min, y_max)).
         """
         class Clip:
-            def __init__(clp, primitive):
-                x_range, y_range = primitive.bounding_box
+            def __init__(clp, bounding_box):
+                x_range, y_range = bounding_box
                 xmin, xmax = x_range
                 ymin, ymax = y_range
 
@@ -593,9 +738,9 @@ class GerberCairoContext(GerberContext):
                 # We need to offset Y to take care of the difference in y-pos
                 # caused by flipping the axis.
                 clp.ymin = math.floor(
-                    (self.scale[1] * ymin) - math.ceil(self.origin_in_pixels[1]))
+                    (self.scale[1] * ymin) - math.ceil(self._layer_origin[1]))
                 clp.ymax = math.floor(
-                    (self.scale[1] * ymax) - math.floor(self.origin_in_pixels[1]))
+                    (self.scale[1] * ymax) - math.floor(self._layer_origin[1]))
 
                 # Calculate width and height, rounded to the nearest pixel
                 clp.width = abs(clp.xmax - clp.xmin)
@@ -610,7 +755,8 @@ class GerberCairoContext(GerberContext):
                 # Reset context clip region
                 self.ctx.reset_clip()
 
-        return Clip(primitive)
+        return Clip(bounding_box)
 
     def scale_point(self, point):
-        return tuple([coord * scale for coord, scale in zip(point, self.scale)])
+        sx, sy = self.scale
+        return (point[0] * sx, point[1] * sy)
@@ -26,9 +26,6 @@ currently supports SVG rendering using the `svgwrite` library.
 
 
 from ..primitives import *
-from ..gerber_statements import (CommentStmt, UnknownStmt, EofStmt, ParamStmt,
-                                 CoordStmt, ApertureStmt, RegionModeStmt,
-                                 QuadrantModeStmt,)
 
 
 class GerberContext(object):
@@ -59,6 +56,23 @@ class GerberContext(object):
         Rendering opacity. Between 0.0 (transparent) and 1.0 (opaque.)
     """
 
+    # Primitive types and the method that renders them. Outlines are drawn
+    # as regions.
+    RENDERERS = (
+        (Line, '_render_line'),
+        (Arc, '_render_arc'),
+        (Region, '_render_region'),
+        (Circle, '_render_circle'),
+        (Rectangle, '_render_rectangle'),
+        (Obround, '_render_obround'),
+        (Polygon, '_render_polygon'),
+        (Drill, '_render_drill'),
+        (Slot, '_render_slot'),
+        (AMGroup, '_render_amgroup'),
+        (Outline, '_render_region'),
+        (TestRecord, '_render_test_record'),
+    )
+
     def __init__(self, units='inch'):
         self._units = units
         self._color = (0.7215, 0.451, 0.200)
@@ -67,6 +81,7 @@ class GerberContext(object):
         self._alpha = 1.0
         self._invert = False
         self.ctx = None
+        self._renderers = {}
 
     @property
     def units(self):
@@ -141,34 +156,28 @@ class GerberContext(object):
 
         self.pre_render_primitive(primitive)
 
-        color = self.color
-        if isinstance(primitive, Line):
-            self._render_line(primitive, color)
-        elif isinstance(primitive, Arc):
-            self._render_arc(primitive, color)
-        elif isinstance(primitive, Region):
-            self._render_region(primitive, color)
-        elif isinstance(primitive, Circle):
-            self._render_circle(primitive, color)
-        elif isinstance(primitive, Rectangle):
-            self._render_rectangle(primitive, color)
-        elif isinstance(primitive, Obround):
-            self._render_obround(primitive, color)
-        elif isinstance(primitive, Polygon):
-            self._render_polygon(primitive, color)
-        elif isinstance(primitive, Drill):
-            self._render_drill(primitive, self.color)
-        elif isinstance(primitive, Slot):
-            self._render_slot(primitive, self.color)
-        elif isinstance(primitive, AMGroup):
-            self._render_amgroup(primitive, color)
-        elif isinstance(primitive, Outline):
-            self._render_region(primitive, color)
-        elif isinstance(primitive, TestRecord):
-            self._render_test_record(primitive, color)
+        primitive_type = type(primitive)
+        try:
+            renderer = self._renderers[primitive_type]
+        except KeyError:
+            renderer = self._renderers[primitive_type] = \
+                self._find_renderer(primitive_type)
+        if renderer is not None:
+            renderer(primitive, self.color)
 
         self.post_render_primitive(primitive)
 
+    def _find_renderer(self, primitive_type):
+        """ Look up the bound method rendering primitives of `primitive_type`.
+
+        Done once per primitive type, after which render() dispatches on the
+        type directly. Types with no renderer are cached as None and skipped.
+        """
+        for types, name in self.RENDERERS:
+            if issubclass(primitive_type, types):
+                return getattr(self, name)
+        return None
+
     def set_bounds(self, bounds, *args, **kwargs):
         """Called by the renderer to set the extents of the file to render.
 
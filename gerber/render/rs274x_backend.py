@@ -200,8 +200,8 @@ class Rs274xContext(GerberContext):
         point = self._simplify_point(line.end)
 
         # In some files, we see a lot of duplicated ponts, so omit those
-        if point[0] != None or point[1] != None:
-            self.body.append(CoordStmt.line(func, self._simplify_point(line.end)))
+        if point[0] is not None or point[1] is not None:
+            self.body.append(CoordStmt.line(func, point))
             self._pos = line.end
         elif func:
             self.body.append(CoordStmt.mode(func))
@@ -473,7 +473,7 @@ class Rs274xContext(GerberContext):
 
             # Store the dcode and the original so we can check if it really is the same
             # If it didn't have a postition, set it to 0, 0
-            if amgroup.position == None:
+            if amgroup.position is None:
                 amgroup.position = (0, 0)
             macro = (aperdef, amgroup)
 
@@ -32,7 +32,16 @@ except(ImportError):
 from .gerber_statements import *
 from .primitives import *
 from .cam import CamFile, FileSettings
-from .utils import sq_distance
+from .utils import bounding_box_union
+
+
+# Function and operation codes, with and without the optional leading zero
+_LINEAR_FUNCTIONS = frozenset(('G01', 'G1'))
+_ARC_FUNCTIONS = frozenset(('G02', 'G2', 'G03', 'G3'))
+_CLOCKWISE_FUNCTIONS = frozenset(('G02', 'G2'))
+_DRAW_OPS = frozenset(('D01', 'D1'))
+_MOVE_OPS = frozenset(('D02', 'D2'))
+_FLASH_OPS = frozenset(('D03', 'D3'))
 
 
 def read(filename):
@@ -133,18 +142,10 @@ class GerberFile(CamFile):
 
     @property
     def bounding_box(self):
-        min_x = min_y = 1000000
-        max_x = max_y = -1000000
-
-        for prim in self.primitives:
-            bounds = prim.bounding_box
-            min_x = min(bounds[0][0], min_x)
-            max_x = max(bounds[0][1], max_x)
-
-            min_y = min(bounds[1][0], min_y)
-            max_y = max(bounds[1][1], max_y)
-
-        return ((min_x, max_x), (min_y, max_y))
+        if not self.primitives:
+            return ((1000000, -1000000), (1000000, -1000000))
+        return bounding_box_union(prim.bounding_box
+                                  for prim in self.primitives)
 
     def write(self, filename, settings=None):
         """ Write data out to a gerber file.
@@ -237,6 +238,16 @@ class GerberParser(object):
     # Keep include loop from crashing us
     INCLUDE_FILE_RECURSION_LIMIT = 10
 
+    # Statement types and the method that evaluates them. None means the
+    # statement doesn't affect the image.
+    EVALUATORS = (
+        (CoordStmt, '_evaluate_coord'),
+        (ParamStmt, '_evaluate_param'),
+        (ApertureStmt, '_evaluate_aperture'),
+        ((RegionModeStmt, QuadrantModeStmt), '_evaluate_mode'),
+        ((CommentStmt, UnknownStmt, DeprecatedStmt, EofStmt), None),
+    )
+
     def __init__(self):
         self.filename = None
         self.settings = FileSettings()
@@ -257,6 +268,7 @@ class GerberParser(object):
         self.quadrant_mode = 'multi-quadrant'
         self.step_and_repeat = (1, 1, 0, 0)
         self._recursion_depth = 0
+        self._evaluators = {}
 
     def parse(self, filename):
         self.filename = filename
@@ -491,23 +503,25 @@ class GerberParser(object):
             Gerber/Excellon statement to evaluate.
 
         """
-        if isinstance(stmt, CoordStmt):
-            self._evaluate_coord(stmt)
-
-        elif isinstance(stmt, ParamStmt):
-            self._evaluate_param(stmt)
-
-        elif isinstance(stmt, ApertureStmt):
-            self._evaluate_aperture(stmt)
-
-        elif isinstance(stmt, (RegionModeStmt, QuadrantModeStmt)):
-            self._evaluate_mode(stmt)
-
-        elif isinstance(stmt, (CommentStmt, UnknownStmt, DeprecatedStmt, EofStmt)):
-            return
-
-        else:
-            raise Exception("Invalid statement to evaluate")
+        stmt_type = type(stmt)
+        try:
+            evaluator = self._evaluators[stmt_type]
+        except KeyError:
+            evaluator = self._evaluators[stmt_type] = \
+                self._find_evaluator(stmt_type)
+        if evaluator is not None:
+            evaluator(stmt)
+
+    def _find_evaluator(self, stmt_type):
+        """ Look up the bound method evaluating statements of `stmt_type`.
+
+        Done once per statement type, after which evaluate() dispatches on
+        the type directly.
+        """
+        for types, name in self.EVALUATORS:
+            if issubclass(stmt_type, types):
+                return getattr(self, name) if name is not None else None
+        raise Exception("Invalid statement to evaluate")
 
     def _define_aperture(self, d, shape, modifiers):
         aperture = None
@@ -616,15 +630,18 @@ class GerberParser(object):
             self._define_aperture(stmt.d, stmt.shape, stmt.modifiers)
 
     def _evaluate_coord(self, stmt):
+        # Every draw and flash in a file comes through here, so statement
+        # and parser state are read into locals once.
         x = self.x if stmt.x is None else stmt.x
         y = self.y if stmt.y is None else stmt.y
 
-        if stmt.function in ("G01", "G1"):
+        function = stmt.function
+        if function in _LINEAR_FUNCTIONS:
             self.interpolation = 'linear'
-        elif stmt.function in ('G02', 'G2', 'G03', 'G3'):
+        elif function in _ARC_FUNCTIONS:
             self.interpolation = 'arc'
-            self.direction = ('clockwise' if stmt.function in
-                              ('G02', 'G2') else 'counterclockwise')
+            self.direction = ('clockwise' if function in _CLOCKWISE_FUNCTIONS
+                              else 'counterclockwise')
 
         if stmt.only_function:
             # Sometimes we get a coordinate statement
@@ -633,93 +650,77 @@ class GerberParser(object):
             return
 
         if stmt.op:
-            self.op = stmt.op
+            op = self.op = stmt.op
         else:
             # no implicit op allowed, force here if coord block doesn't have it
-            stmt.op = self.op
+            op = stmt.op = self.op
 
-        if self.op == "D01" or self.op == "D1":
+        level_polarity = self.level_polarity
+        units = self.settings.units
+        region_mode = self.region_mode
+
+        if op in _DRAW_OPS:
             start = (self.x, self.y)
             end = (x, y)
 
+            if region_mode == 'off':
+                aperture = self.apertures[self.aperture]
+            else:
+                # from gerber spec revision J3, Section 4.5, page 55:
+                #  The segments are not graphics objects in themselves; segments are part of region which is the graphics object. The segments have no thickness.
+                # The current aperture is associated with the region.
+                # This has no graphical effect, but allows all its attributes to
+                # be applied to the region.
+                aperture = self.apertures.get(self.aperture, Circle((0, 0), 0))
+                if self.current_region is None:
+                    self.current_region = []
+
             if self.interpolation == 'linear':
-                if self.region_mode == 'off':
-                    self.primitives.append(Line(start, end,
-                                                self.apertures[self.aperture],
-                                                level_polarity=self.level_polarity,
-                                                units=self.settings.units))
-                else:
-                    # from gerber spec revision J3, Section 4.5, page 55:
-                    #  The segments are not graphics objects in themselves; segments are part of region which is the graphics object. The segments have no thickness.
-                    # The current aperture is associated with the region.
-                    # This has no graphical effect, but allows all its attributes to
-                    # be applied to the region.
-
-                    if self.current_region is None:
-                        self.current_region = [Line(start, end,
-                                                    self.apertures.get(self.aperture,
-                                                                       Circle((0, 0), 0)),
-                                                    level_polarity=self.level_polarity,
-                                                    units=self.settings.units), ]
-                    else:
-                        self.current_region.append(Line(start, end,
-                                                        self.apertures.get(self.aperture,
-                                                                           Circle((0, 0), 0)),
-                                                        level_polarity=self.level_polarity,
-                                                        units=self.settings.units))
+                primitive = Line(start, end, aperture,
+                                 level_polarity=level_polarity, units=units)
             else:
                 i = 0 if stmt.i is None else stmt.i
                 j = 0 if stmt.j is None else stmt.j
                 center = self._find_center(start, end, (i, j))
-                if self.region_mode == 'off':
-                    self.primitives.append(Arc(start, end, center, self.direction,
-                                               self.apertures[self.aperture],
-                                               quadrant_mode=self.quadrant_mode,
-                                               level_polarity=self.level_polarity,
-                                               units=self.settings.units))
-                else:
-                    if self.current_region is None:
-                        self.current_region = [Arc(start, end, center, self.direction,
-                                                   self.apertures.get(self.aperture, Circle((0,0), 0)),
-                                                   quadrant_mode=self.quadrant_mode,
-                                                   level_polarity=self.level_polarity,
-                                                   units=self.settings.units),]
-                    else:
-                        self.current_region.append(Arc(start, end, center, self.direction,
-                                                       self.apertures.get(self.aperture, Circle((0,0), 0)),
-                                                       quadrant_mode=self.quadrant_mode,
-                                                       level_polarity=self.level_polarity,
-                                                       units=self.settings.units))
+                primitive = Arc(start, end, center, self.direction, aperture,
+                                quadrant_mode=self.quadrant_mode,
+                                level_polarity=level_polarity, units=units)
+
+            if region_mode == 'off':
+                self.primitives.append(primitive)
+            else:
+                self.current_region.append(primitive)
+                if self.interpolation != 'linear':
                     # Gerbv seems to reset interpolation mode in regions..
                     # TODO: Make sure this is right.
                     self.interpolation = 'linear'
 
-        elif self.op == "D02" or self.op == "D2":
+        elif op in _MOVE_OPS:
 
-            if self.region_mode == "on":
+            if region_mode == "on":
                 # D02 in the middle of a region finishes that region and starts a new one
                 if self.current_region and len(self.current_region) > 1:
                     self.primitives.append(Region(self.current_region,
-                                                  level_polarity=self.level_polarity,
-                                                  units=self.settings.units))
+                                                  level_polarity=level_polarity,
+                                                  units=units))
                 self.current_region = None
 
-        elif self.op == "D03" or self.op == "D3":
+        elif op in _FLASH_OPS:
             primitive = copy.deepcopy(self.apertures[self.aperture])
 
             if primitive is not None:
 
                 if not isinstance(primitive, AMParamStmt):
                     primitive.position = (x, y)
-                    primitive.level_polarity = self.level_polarity
-                    primitive.units = self.settings.units
+                    primitive.level_polarity = level_polarity
+                    primitive.units = units
                     self.primitives.append(primitive)
                 else:
                     # Aperture Macro
                     for am_prim in primitive.primitives:
                         renderable = am_prim.to_primitive((x, y),
-                                                          self.level_polarity,
-                                                          self.settings.units)
+                                                          level_polarity,
+                                                          units)
                         if renderable is not None:
                             self.primitives.append(renderable)
         self.x, self.y = x, y
@@ -742,14 +743,22 @@ class GerberParser(object):
 
             sqdist_diff_min = sys.maxsize
             center = None
-            for factors in [(1, 1), (1, -1), (-1, 1), (-1, -1)]:
+            atan2 = math.atan2
+            start_x, start_y = start
+            end_x, end_y = end
+            offset_x, offset_y = offsets
+            for factor_x, factor_y in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
 
-                test_center = (start[0] + offsets[0] * factors[0],
-                               start[1] + offsets[1] * factors[1])
+                center_x = start_x + offset_x * factor_x
+                center_y = start_y + offset_y * factor_y
 
                 # Find angle from center to start and end points
-                start_angle = math.atan2(*reversed([_start - _center for _start, _center in zip(start, test_center)]))
-                end_angle = math.atan2(*reversed([_end - _center for _end, _center in zip(end, test_center)]))
+                start_dx = start_x - center_x
+                start_dy = start_y - center_y
+                end_dx = end_x - center_x
+                end_dy = end_y - center_y
+                start_angle = atan2(start_dy, start_dx)
+                end_angle = atan2(end_dy, end_dx)
 
                 # Clamp angles to 0, 2pi
                 theta0 = (start_angle + two_pi) % two_pi
@@ -763,8 +772,8 @@ class GerberParser(object):
                     sweep_angle = abs(theta0 - theta1) % two_pi
 
                 # Calculate the radius error
-                sqdist_start = sq_distance(start, test_center)
-                sqdist_end = sq_distance(end, test_center)
+                sqdist_start = start_dx * start_dx + start_dy * start_dy
+                sqdist_end = end_dx * end_dx + end_dy * end_dy
                 sqdist_diff = abs(sqdist_start - sqdist_end)
 
                 # Take the option with the lowest radius error from the set of
@@ -774,7 +783,7 @@ class GerberParser(object):
                 is_lowest_radius_error = sqdist_diff < sqdist_diff_min
                 is_valid_sweep_angle = sweep_angle >= 0 and sweep_angle <= math.pi / 2.0 + 1e-6
                 if is_lowest_radius_error and is_valid_sweep_angle:
-                    center = test_center
+                    center = (center_x, center_y)
                     sqdist_diff_min = sqdist_diff
             return center
         else:
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Spatial Index
+=============
+**Bounding box queries over collections of primitives**
+
+Used to prune candidate pairs (sweep & prune) before running exact geometric
+tests such as DRC clearance checks. If the optional `rtree` package is
+installed, large collections are indexed with an R-tree. Otherwise the
+bounding boxes are scanned directly.
+"""
+
+try:
+    from rtree import index as rtree_index
+except ImportError:
+    rtree_index = None
+
+
+class PrimitiveIndex(object):
+    """ Spatial index over primitive bounding boxes
+
+    Parameters
+    ----------
+    primitives : iterable of :class:`gerber.primitives.Primitive`
+        Primitives to index. The index is a snapshot: it must be rebuilt if
+        the primitives are moved or converted to other units.
+
+    Attributes
+    ----------
+    primitives : list
+        The indexed primitives, in their original order.
+    """
+
+    #: Collections this small are scanned directly, as building and querying
+    #: an R-tree costs more than it saves.
+    BRUTE_FORCE_THRESHOLD = 32
+
+    def __init__(self, primitives):
+        self.primitives = list(primitives)
+        self._bounding_boxes = [p.bounding_box for p in self.primitives]
+        self._index = None
+        if (rtree_index is not None and
+                len(self.primitives) > self.BRUTE_FORCE_THRESHOLD):
+            self._index = rtree_index.Index(
+                (i, (min_x, min_y, max_x, max_y), None)
+                for i, ((min_x, max_x), (min_y, max_y))
+                in enumerate(self._bounding_boxes))
+
+    def __len__(self):
+        return len(self.primitives)
+
+    def candidates(self, bounding_box):
+        """ Find primitives whose bounding box intersects `bounding_box`
+
+        Parameters
+        ----------
+        bounding_box : tuple
+            Query box as ((min x, max x), (min y, max y)). Boxes that only
+            touch the query box are included.
+
+        Returns
+        -------
+        primitives : list
+            Matching primitives, in index order.
+        """
+        (min_x, max_x), (min_y, max_y) = bounding_box
+        if self._index is not None:
+            ids = sorted(self._index.intersection((min_x, min_y, max_x, max_y)))
+        else:
+            ids = [i for i, ((x0, x1), (y0, y1))
+                   in enumerate(self._bounding_boxes)
+                   if x0 <= max_x and x1 >= min_x
+                   and y0 <= max_y and y1 >= min_y]
+        return [self.primitives[i] for i in ids]
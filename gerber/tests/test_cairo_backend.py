@@ -4,10 +4,13 @@
 # Author: Garret Fick <garret@ficksworkshop.com>
 import os
 import shutil
+import sys
 import tempfile
 
-from ..render.cairo_backend import GerberCairoContext
-from ..rs274x import read
+from ..layers import PCBLayer
+from ..primitives import Arc, Circle, Obround
+from ..render.cairo_backend import GerberCairoContext, cairo
+from ..rs274x import loads, read
 
 
 def _DISABLED_test_render_two_boxes():
@@ -192,10 +195,148 @@ def test_render_svg_simple_contour():
     _test_simple_render_svg("resources/example_simple_contour.gbr")
 
 
+def test_render_layers_png_surface():
+    """Rendering layers to PNG draws into an image surface, SVG into an SVG surface"""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        for name, surface_type in (("output.png", cairo.ImageSurface),
+                                   ("output.svg", cairo.SVGSurface)):
+            layer = _load_layer("resources/example_two_square_boxes.gbr")
+            ctx = GerberCairoContext()
+            output_path = os.path.join(temp_dir, name)
+            ctx.render_layers([layer], output_path)
+            assert isinstance(ctx.surface, surface_type)
+            assert os.path.exists(output_path)
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_render_layer_moire_macro():
+    """Flashing a macro with no drawable primitives does not stop the layer rendering"""
+    layer = _load_layer("resources/example_flash_moire_macro.gbr")
+    ctx = GerberCairoContext()
+    ctx.render_layer(layer)
+    assert ctx._render_count == 1
+
+
+def test_render_traces_batched_matches_unbatched():
+    """Stroking trace runs together gives the same pixels as one trace at a time"""
+    layer = _load_layer("resources/example_trace_polarity.gbr")
+    images = []
+    for batch_traces in (True, False):
+        ctx = GerberCairoContext()
+        ctx.batch_traces = batch_traces
+        ctx.render_layer(layer, svg=False)
+        images.append(bytearray(ctx.surface.get_data()))
+    assert images[0] == images[1]
+
+
+def test_render_obround_horizontal():
+    """A horizontal obround fills its bounding box"""
+    _assert_fills_bounding_box(Obround((0.5, 0.5), 0.4, 0.2))
+
+
+def test_render_obround_vertical():
+    """A vertical obround fills its bounding box"""
+    _assert_fills_bounding_box(Obround((0.5, 0.5), 0.2, 0.4))
+
+
+def test_render_obround_square():
+    """An obround as wide as it is tall renders as a circle"""
+    _assert_fills_bounding_box(Obround((0.5, 0.5), 0.2, 0.2))
+
+
+def test_render_arc():
+    """A quarter arc fills its bounding box"""
+    arc = Arc((0.6, 0.5), (0.5, 0.6), (0.5, 0.5), "counterclockwise",
+              Circle((0, 0), 0.01), "multi-quadrant", level_polarity="dark")
+    # The outermost pixels of the round caps are only partly covered
+    _assert_fills_bounding_box(arc, pixels=2)
+
+
+def test_render_arc_sub_pixel():
+    """An arc smaller than a pixel still marks the pixels it lies in"""
+    arc = Arc((0.5005, 0.5), (0.5, 0.5005), (0.5, 0.5), "counterclockwise",
+              Circle((0, 0), 0.002), "multi-quadrant", level_polarity="dark")
+    (min_x, max_x), (min_y, max_y) = _filled_bounds(arc, threshold=0)
+    (box_min_x, box_max_x), (box_min_y, box_max_y) = arc.bounding_box
+    pixel = 1.0 / 300
+    assert box_min_x - pixel <= min_x < max_x <= box_max_x + pixel
+    assert box_min_y - pixel <= min_y < max_y <= box_max_y + pixel
+
+
+def _assert_fills_bounding_box(primitive, scale=300, pixels=1):
+    """Check the filled pixels of a rendered primitive match its bounding box to `pixels` pixels"""
+    (min_x, max_x), (min_y, max_y) = _filled_bounds(primitive, scale=scale)
+    (box_min_x, box_max_x), (box_min_y, box_max_y) = primitive.bounding_box
+    pixel = float(pixels) / scale
+    assert abs(min_x - box_min_x) <= pixel
+    assert abs(max_x - box_max_x) <= pixel
+    assert abs(min_y - box_min_y) <= pixel
+    assert abs(max_y - box_max_y) <= pixel
+
+
 def _resolve_path(path):
     return os.path.join(os.path.dirname(__file__), path)
 
 
+def _load_layer(gerber_path, layer_class="top"):
+    """Load a Gerber file as a PCB layer."""
+    with open(_resolve_path(gerber_path), "r") as gerber_file:
+        gerber = loads(gerber_file.read(), gerber_path)
+    return PCBLayer(gerber_path, layer_class, gerber)
+
+
+def _filled_bounds(primitive, threshold=127, margin=0.1, scale=300):
+    """Render a single primitive and return the bounds of its filled pixels.
+
+    Parameters
+    ----------
+    primitive : :class:`gerber.primitives.Primitive`
+        Primitive to render
+    threshold : int
+        Pixels with an alpha above this value count as filled
+
+    Returns
+    -------
+    bounds : tuple
+        ((min x, max x), (min y, max y)) of the filled pixels in file units,
+        or None if no pixel is filled
+    """
+    (min_x, max_x), (min_y, max_y) = primitive.bounding_box
+    ctx = GerberCairoContext(scale)
+    ctx.set_bounds(((min_x - margin, max_x + margin),
+                    (min_y - margin, max_y + margin)), svg=False)
+    ctx.invert = False
+    ctx.new_render_layer()
+    ctx.render(primitive)
+    ctx.flatten((1.0, 1.0, 1.0), 1.0)
+
+    surface = ctx.surface
+    surface.flush()
+    data = bytearray(surface.get_data())
+    stride = surface.get_stride()
+    # ARGB32 pixels are native-endian 32-bit words
+    alpha = 3 if sys.byteorder == "little" else 0
+    cols = []
+    rows = []
+    for row in range(surface.get_height()):
+        for col in range(surface.get_width()):
+            if data[row * stride + col * 4 + alpha] > threshold:
+                cols.append(col)
+                rows.append(row)
+    if not cols:
+        return None
+
+    # Rows count down from the top of the image
+    origin_x = min_x - margin
+    top_y = max_y + margin
+    return ((origin_x + min(cols) / float(scale),
+             origin_x + (max(cols) + 1) / float(scale)),
+            (top_y - (max(rows) + 1) / float(scale),
+             top_y - min(rows) / float(scale)))
+
+
 def _test_render(gerber_path, png_expected_path, create_output_path=None):
     """Render the gerber file and compare to the expected PNG output.
 
@@ -364,3 +364,14 @@ M16
     assert (
         len([stmt for stmt in uut.statements if isinstance(stmt, RouteModeStmt)]) == 2
     )
+
+
+def test_drill_features_slots():
+    """ Test drill hits and slots don't carry a per-instance __dict__
+    """
+    settings = FileSettings(units="inch")
+    tool = ExcellonTool(settings, diameter=1.0)
+    hit = DrillHit(tool, (1.0, 1.0))
+    slot = DrillSlot(tool, (1.0, 1.0), (2.0, 1.0), DrillSlot.TYPE_ROUT)
+    assert not hasattr(hit, '__dict__')
+    assert not hasattr(slot, '__dict__')
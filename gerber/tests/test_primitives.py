@@ -3,9 +3,11 @@
 
 # Author: Hamilton Kibbe <ham@hamiltonkib.be>
 
+import copy
 import pytest
 from operator import add
 from ..primitives import *
+from ..am_statements import AMCirclePrimitive
 
 
 def test_primitive_smoketest():
@@ -42,7 +44,7 @@ def test_line_angle():
     for start, end, expected in cases:
         l = Line(start, end, 0)
         line_angle = (l.angle + 2 * math.pi) % (2 * math.pi)
-        pytest.approx(line_angle, expected)
+        assert line_angle == pytest.approx(expected)
 
 
 def test_line_bounds():
@@ -97,6 +99,26 @@ def test_line_vertices():
         l = Line(start, end, r)
         assert set(vertices) == set(l.vertices)
 
+    # Outline is counterclockwise from the lower left, whichever way the
+    # line was drawn
+    r = Rectangle((0, 0), 2, 1)
+    expected = [(-1, -0.5), (2, -2.5), (4, -2.5), (4, -1.5), (1, 0.5),
+                (-1, 0.5)]
+    assert Line((0, 0), (3, -2), r).vertices == expected
+    assert Line((3, -2), (0, 0), r).vertices == expected
+
+
+def test_line_vertices_polygon_aperture():
+    """ Test the outline of a line drawn with a polygon aperture
+    """
+    p = Polygon((0, 0), 4, 1)
+    l = Line((0, 0), (2, 0), p)
+    expected = [(-1, 0), (0, -1), (2, -1), (3, 0), (2, 1), (0, 1)]
+    assert len(l.vertices) == len(expected)
+    for vertex in expected:
+        assert any(v == pytest.approx(vertex) for v in l.vertices)
+    assert l.bounding_box == ((-1, 3), (-1, 1))
+
 
 def test_line_conversion():
     c = Circle((0, 0), 25.4, units="metric")
@@ -167,6 +189,22 @@ def test_line_offset():
     assert l.end == (2.0, 2.0)
 
 
+def test_noop_changes_keep_caches():
+    """ Test zero offsets and unchanged rotations keep cached geometry
+    """
+    c = Circle((0, 0), 1)
+    l = Line((0, 0), (1, 1), c)
+    bounds = l.bounding_box
+    l.offset(0, 0)
+    assert l.bounding_box is bounds
+    r = Rectangle((0, 0), 2, 1, rotation=45)
+    vertices = r.vertices
+    r.rotation = 45
+    assert r.vertices is vertices
+    r.rotation = 90
+    assert r.vertices is not vertices
+
+
 def test_arc_radius():
     """ Test Arc primitive radius calculation
     """
@@ -193,6 +231,22 @@ def test_arc_sweep_angle():
         assert a.sweep_angle == sweep
 
 
+def test_arc_cached_geometry_update():
+    """ Test Arc radius and angles follow changes to its definition
+    """
+    c = Circle((0, 0), 1)
+    a = Arc((1, 0), (0, 1), (0, 0), "counterclockwise", c, "single-quadrant")
+    assert a.radius == 1
+    assert a.sweep_angle == pytest.approx(math.radians(90))
+    a.direction = "clockwise"
+    assert a.sweep_angle == pytest.approx(math.radians(270))
+    a.start = (2, 0)
+    a.end = (0, 2)
+    assert a.radius == 2
+    assert a.start_angle == 0
+    assert a.end_angle == pytest.approx(math.radians(90))
+
+
 def test_arc_bounds():
     """ Test Arc primitive bounding box calculation
     """
@@ -426,6 +480,10 @@ def test_ellipse_bounds():
     assert e.bounding_box == ((0, 4), (1, 3))
     e = Ellipse((2, 2), 4, 2, rotation=270)
     assert e.bounding_box == ((1, 3), (0, 4))
+    e = Ellipse((0, 0), 4, 2, rotation=45)
+    xbounds, ybounds = e.bounding_box
+    assert xbounds == pytest.approx((-math.sqrt(2.5), math.sqrt(2.5)))
+    assert ybounds == pytest.approx((-math.sqrt(2.5), math.sqrt(2.5)))
 
 
 def test_ellipse_conversion():
@@ -510,6 +568,32 @@ def test_rectangle_bounds():
     pytest.approx(ybounds, (-math.sqrt(2), math.sqrt(2)))
 
 
+def test_rectangle_corners():
+    """ Test rectangle corners agree with the bounding box
+    """
+    r = Rectangle((1, 1), 2, 4)
+    assert r.lower_left == (0, -1)
+    assert r.upper_right == (2, 3)
+    r.position = (0, 0)
+    assert r.lower_left == (-1, -2)
+    assert r.upper_right == (1, 2)
+
+
+def test_rectangle_axis_aligned_update():
+    """ Test cached axis aligned dimensions follow rotation and size
+    """
+    r = Rectangle((0, 0), 4, 2)
+    assert (r.axis_aligned_width, r.axis_aligned_height) == (4, 2)
+    r.rotation = 90
+    assert r.axis_aligned_width == pytest.approx(2)
+    assert r.axis_aligned_height == pytest.approx(4)
+    r.width = 6
+    assert r.axis_aligned_height == pytest.approx(6)
+    r.rotation = 180
+    assert r.axis_aligned_width == pytest.approx(6)
+    assert r.axis_aligned_height == pytest.approx(2)
+
+
 def test_rectangle_vertices():
     sqrt2 = math.sqrt(2.0)
     TEST_VECTORS = [
@@ -538,6 +622,12 @@ def test_rectangle_vertices():
     ):
         pytest.approx(test, expect)
 
+    # Rotation is about the rectangle's own centre
+    r = Rectangle((10, 5), 4.0, 2.0, rotation=90.0)
+    expected = ((11.0, 3.0), (9.0, 3.0), (9.0, 7.0), (11.0, 7.0))
+    for test, expect in zip(r.vertices, expected):
+        assert test == pytest.approx(expect)
+
 
 def test_rectangle_segments():
 
@@ -545,6 +635,8 @@ def test_rectangle_segments():
     expected = [vtx for segment in r.segments for vtx in segment]
     for vertex in r.vertices:
         assert vertex in expected
+    assert r.segments == [((-1, -1), (-1, 1)), ((-1, 1), (1, 1)),
+                          ((1, 1), (1, -1)), ((1, -1), (-1, -1))]
 
 
 def test_rectangle_conversion():
@@ -703,6 +795,17 @@ def test_diamond_offset():
     assert d.position == (1.0, 1.0)
 
 
+def test_diamond_vertices():
+    """ Test diamond vertices, rotated about the diamond's centre
+    """
+    d = Diamond((1, 1), 2, 4)
+    assert d.vertices == [(1, 3), (2, 1), (1, -1), (0, 1)]
+    d.rotation = 90
+    expected = [(-1, 1), (1, 2), (3, 1), (1, 0)]
+    for vertex, expect in zip(d.vertices, expected):
+        assert vertex == pytest.approx(expect)
+
+
 def test_chamfer_rectangle_ctor():
     """ Test chamfer rectangle creation
     """
@@ -827,6 +930,15 @@ def test_chamfer_rectangle_vertices():
         r = ChamferRectangle((0, 0), 5, 5, chamfer, corners)
         assert set(r.vertices) == set(expected)
 
+    # Rotation is about the rectangle's own centre
+    r = ChamferRectangle((10, 10), 5, 5, 1.0, (True, False, False, False),
+                         rotation=90)
+    expected = ((12.5, 7.5), (7.5, 7.5), (7.5, 11.5), (8.5, 12.5),
+                (12.5, 12.5))
+    assert len(r.vertices) == len(expected)
+    for vertex, expect in zip(sorted(r.vertices), sorted(expected)):
+        assert vertex == pytest.approx(expect)
+
 
 def test_round_rectangle_ctor():
     """ Test round rectangle creation
@@ -946,14 +1058,38 @@ def test_obround_orientation():
 def test_obround_subshapes():
     o = Obround((0, 0), 1, 4)
     ss = o.subshapes
-    pytest.approx(ss["rectangle"].position, (0, 0))
-    pytest.approx(ss["circle1"].position, (0, 1.5))
-    pytest.approx(ss["circle2"].position, (0, -1.5))
+    assert ss.rectangle.position == pytest.approx((0, 0))
+    assert ss.circle1.position == pytest.approx((0, 1.5))
+    assert ss.circle2.position == pytest.approx((0, -1.5))
     o = Obround((0, 0), 4, 1)
     ss = o.subshapes
-    pytest.approx(ss["rectangle"].position, (0, 0))
-    pytest.approx(ss["circle1"].position, (1.5, 0))
-    pytest.approx(ss["circle2"].position, (-1.5, 0))
+    assert ss.rectangle.position == pytest.approx((0, 0))
+    assert ss.circle1.position == pytest.approx((1.5, 0))
+    assert ss.circle2.position == pytest.approx((-1.5, 0))
+
+
+def test_obround_subshapes_cached():
+    o = Obround((0, 0), 1, 4)
+    ss = o.subshapes
+    assert o.subshapes is ss
+    o.position = (1, 1)
+    assert o.subshapes is not ss
+    assert o.subshapes.rectangle.position == (1, 1)
+    o.offset(1, 2)
+    assert o.subshapes.rectangle.position == (2, 3)
+    assert o.subshapes.circle1.position == pytest.approx((2, 4.5))
+    assert o.bounding_box == ((1.5, 2.5), (1, 5))
+
+
+def test_obround_offset_keeps_returned_subshapes():
+    o = Obround((0, 0), 1, 4)
+    ss = o.subshapes
+    o.offset(1, 1)
+    assert ss.rectangle.position == (0, 0)
+    assert ss.circle1.position == pytest.approx((0, 1.5))
+    assert ss.circle2.position == pytest.approx((0, -1.5))
+    assert o.subshapes is not ss
+    assert o.subshapes.rectangle.position == (1, 1)
 
 
 def test_obround_conversion():
@@ -1063,6 +1199,19 @@ def test_polygon_conversion():
     assert p.radius == 254.0
 
 
+def test_polygon_vertices():
+    """ Test polygon vertices follow rotation and number of sides
+    """
+    p = Polygon((1, 1), 4, 2)
+    expected = [(3, 1), (1, 3), (-1, 1), (1, -1)]
+    for vertex, expect in zip(p.vertices, expected):
+        assert vertex == pytest.approx(expect)
+    p.rotation = 90
+    assert p.vertices[0] == pytest.approx((1, 3))
+    p.sides = 3
+    assert len(p.vertices) == 3
+
+
 def test_polygon_offset():
     p = Polygon((0, 0), 5, 10, 0)
     p.offset(1, 0)
@@ -1099,8 +1248,20 @@ def test_region_bounds():
     )
     r = Region(lines)
     xbounds, ybounds = r.bounding_box
-    pytest.approx(xbounds, (0, 1))
-    pytest.approx(ybounds, (0, 1))
+    assert xbounds == pytest.approx((0, 1))
+    assert ybounds == pytest.approx((0, 1))
+
+    # Arcs may bulge past their endpoints
+    prims = (
+        Line((0, 0), (1, 0), apt),
+        Arc((1, 0), (-1, 0), (0, 0), 'counterclockwise', apt,
+            'multi-quadrant'),
+        Line((-1, 0), (0, 0), apt),
+    )
+    r = Region(prims)
+    xbounds, ybounds = r.bounding_box
+    assert xbounds == pytest.approx((-1, 1))
+    assert ybounds == pytest.approx((0, 1))
 
 
 def test_region_offset():
@@ -1119,6 +1280,48 @@ def test_region_offset():
     pytest.approx(new_ylim, tuple([y + 1 for y in ylim]))
 
 
+def test_region_conversion_single_primitive():
+    """ Test a region holding one primitive converts that primitive
+    """
+    line = Line((25.4, 0), (25.4, 25.4), Circle((0, 0), 0, units='metric'),
+                units='metric')
+    r = Region([line], units='metric')
+    r.to_inch()
+    assert line.units == 'inch'
+    assert line.start == (1., 0.)
+    assert line.end == (1., 1.)
+
+
+def test_amgroup_position():
+    """ Test moving an aperture macro group moves its primitives
+    """
+    g = AMGroup([AMCirclePrimitive(1, 'on', 2, (1, 0))], units='inch')
+    assert g.bounding_box == ((0, 2), (-1, 1))
+    g.position = (1, 1)
+    assert g.primitives[0].position == (2, 1)
+    bounds = g.bounding_box
+    assert bounds == ((1, 3), (0, 2))
+    g.position = (1, 1)
+    assert g.bounding_box is bounds
+    g.offset(1, 0)
+    assert g.position == (2, 1)
+    assert g.bounding_box == ((2, 4), (0, 2))
+
+
+def test_amgroup_equivalent():
+    """ Test comparing aperture macro groups ignoring their position
+    """
+    g1 = AMGroup([AMCirclePrimitive(1, 'on', 2, (1, 0))], units='inch')
+    g2 = AMGroup([AMCirclePrimitive(1, 'on', 2, (1, 0))], units='inch')
+    g3 = AMGroup([AMCirclePrimitive(1, 'on', 3, (1, 0))], units='inch')
+    g1.position = (0, 0)
+    g2.position = (1, 2)
+    assert g2.equivalent(g1, (1, 2))
+    assert not g2.equivalent(g1, (0, 0))
+    assert not g3.equivalent(g1, (0, 0))
+    assert not g1.equivalent(Circle((0, 0), 2), (0, 0))
+
+
 def test_round_butterfly_ctor():
     """ Test round butterfly creation
     """
@@ -1188,6 +1391,17 @@ def test_round_butterfly_bounds():
     pytest.approx(ybounds, (-1, 1))
 
 
+def test_round_butterfly_bounds_update():
+    """ Test RoundButterfly bounding box is recalculated after a move
+    """
+    b = RoundButterfly((0, 0), 2)
+    assert b.bounding_box == ((-1, 1), (-1, 1))
+    b.position = (1, 1)
+    assert b.bounding_box == ((0, 2), (0, 2))
+    b.diameter = 4
+    assert b.bounding_box == ((-1, 3), (-1, 3))
+
+
 def test_square_butterfly_ctor():
     """ Test SquareButterfly creation
     """
@@ -1287,6 +1501,13 @@ def test_donut_bounds():
     assert ybounds == (-1.0, 1.0)
 
 
+def test_square_round_donut_bounds():
+    d = SquareRoundDonut((1, 2), 0.5, 2.0)
+    assert d.bounding_box == ((0.0, 2.0), (1.0, 3.0))
+    d.outer_diameter = 4.0
+    assert d.bounding_box == ((-1.0, 3.0), (0.0, 4.0))
+
+
 def test_donut_conversion():
     d = Donut((2.54, 25.4), "round", 254.0, 2540.0, units="metric")
 
@@ -1427,3 +1648,67 @@ def test_slot_bounds():
     for start, end, expected in cases:
         s = Slot(start, end, 2.0)
         assert s.bounding_box == expected
+
+
+def test_slot_bounds_offset():
+    """ Test Slot bounding box is recalculated after an offset
+    """
+    s = Slot((0, 0), (1, 1), 2.0)
+    assert s.bounding_box == ((-1, 2), (-1, 2))
+    s.offset(1, 1)
+    assert s.bounding_box == ((0, 3), (0, 3))
+
+
+def test_primitive_slots():
+    """ Test primitives don't carry a per-instance __dict__
+    """
+    apt = Circle((0, 0), 1)
+    outline = [Line((0, 0), (1, 1), apt), Line((1, 1), (0, 0), apt)]
+    prims = (apt, Rectangle((0, 0), 1, 1), Obround((0, 0), 1, 2),
+             Line((0, 0), (1, 1), apt), Drill((0, 0), 1),
+             Region([Line((0, 0), (1, 1), apt)]),
+             Arc((1, 0), (0, 1), (0, 0), 'clockwise', apt, 'multi-quadrant'),
+             Ellipse((0, 0), 1, 2), Diamond((0, 0), 1, 1),
+             ChamferRectangle((0, 0), 2, 2, 0.1, [True] * 4),
+             RoundRectangle((0, 0), 2, 2, 0.1, [True] * 4),
+             Polygon((0, 0), 6, 1), AMGroup([]), Outline(outline),
+             RoundButterfly((0, 0), 1), SquareButterfly((0, 0), 1),
+             Donut((0, 0), 'round', 0.5, 1), SquareRoundDonut((0, 0), 0.5, 1),
+             Slot((0, 0), (1, 1), 0.5), TestRecord((0, 0), 'GND', 'top'))
+    for p in prims:
+        assert not hasattr(p, '__dict__')
+        assert p == copy.deepcopy(p)
+
+
+def test_primitive_eq():
+    """ Test primitive equality
+    """
+    c = Circle((0, 0), 1)
+    assert c == c
+    assert c == Circle((0, 0), 1)
+    assert c != Circle((0, 0), 2)
+    assert c != Drill((0, 0), 1)
+    assert c != (0, 0)
+
+
+def test_primitive_eq_after_memoized():
+    """ Test reading a memoized property doesn't affect equality
+    """
+    c = Circle((0, 0), 1)
+    c.bounding_box
+    assert c == Circle((0, 0), 1)
+    r = Rectangle((0, 0), 1, 2, rotation=30)
+    r.bounding_box
+    r.vertices
+    r.segments
+    r.axis_aligned_width
+    assert r == Rectangle((0, 0), 1, 2, rotation=30)
+    apt = Circle((0, 0), 0.1)
+    a = Arc((1, 0), (0, 1), (0, 0), 'counterclockwise', apt, 'multi-quadrant')
+    a.bounding_box
+    a.sweep_angle
+    assert a == Arc((1, 0), (0, 1), (0, 0), 'counterclockwise', apt,
+                    'multi-quadrant')
+    o = Obround((0, 0), 1, 2)
+    o.subshapes
+    assert o == Obround((0, 0), 1, 2)
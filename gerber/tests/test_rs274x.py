@@ -5,7 +5,8 @@
 import os
 import pytest
 
-from ..rs274x import read, GerberFile
+from ..gerber_statements import CommentStmt, Statement
+from ..rs274x import read, GerberFile, GerberParser
 
 
 TOP_COPPER_FILE = os.path.join(os.path.dirname(__file__), "resources/top_copper.GTL")
@@ -53,3 +54,10 @@ def test_conversion():
 
     for i, m in zip(top_copper.primitives, top_copper_inch.primitives):
         assert i == m
+
+
+def test_evaluate_dispatch():
+    parser = GerberParser()
+    parser.evaluate(CommentStmt('ignored'))
+    assert parser.primitives == []
+    pytest.raises(Exception, parser.evaluate, Statement('unknown'))
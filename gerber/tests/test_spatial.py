@@ -0,0 +1,57 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from ..primitives import Circle, Rectangle
+from ..spatial import PrimitiveIndex
+
+
+def test_candidates():
+    """ Test spatial index bounding box query
+    """
+    prims = [Circle((0, 0), 1), Circle((2, 0), 1), Rectangle((0, 3), 1, 1)]
+    idx = PrimitiveIndex(prims)
+    assert len(idx) == 3
+    assert idx.candidates(((-0.25, 0.25), (-0.25, 0.25))) == [prims[0]]
+    assert idx.candidates(((0, 2), (0, 0))) == prims[:2]
+    assert idx.candidates(((-1, 1), (1.5, 4))) == [prims[2]]
+    assert idx.candidates(((10, 11), (10, 11))) == []
+
+
+def test_candidates_touching():
+    """ Test boxes touching the query box are candidates
+    """
+    prims = [Circle((0, 0), 1)]
+    idx = PrimitiveIndex(prims)
+    assert idx.candidates(((0.5, 1), (0.5, 1))) == prims
+
+
+def test_candidates_large():
+    """ Test query over a collection above the brute-force threshold
+    """
+    prims = [Circle((x, y), 0.5) for x in range(10) for y in range(10)]
+    idx = PrimitiveIndex(prims)
+    found = idx.candidates(((2.9, 4.1), (2.9, 3.1)))
+    assert [p.position for p in found] == [(3, 3), (4, 3)]
+
+
+def test_candidates_rtree():
+    """ Test query through the R-tree index
+    """
+    pytest.importorskip('rtree')
+    prims = [Circle((x, y), 0.5) for x in range(10) for y in range(10)]
+    idx = PrimitiveIndex(prims)
+    assert idx._index is not None
+    found = idx.candidates(((2.9, 4.1), (2.9, 3.1)))
+    assert [p.position for p in found] == [(3, 3), (4, 3)]
+    assert idx.candidates(((20, 21), (20, 21))) == []
+
+
+def test_intersect_candidates():
+    """ Test finding primitives near a primitive
+    """
+    prims = [Circle((0, 0), 1), Circle((1, 0), 1), Circle((5, 0), 1)]
+    idx = PrimitiveIndex(prims)
+    assert prims[0].intersect_candidates(idx) == [prims[1]]
+    assert prims[2].intersect_candidates(idx) == []
@@ -130,6 +130,17 @@ def test_decimal_padding():
     assert decimal_string(0, precision=6, padding=True) == "0.000000"
 
 
+def test_parse_rounding():
+    """ Test parsed values round the same as the equivalent decimal string
+    """
+    assert parse_gerber_value("123456", (2, 5), "leading") == 1.23456
+    assert parse_gerber_value("-0000003", (3, 4), "none") == -0.0003
+    assert parse_gerber_value("+12", (2, 5), "trailing") == 12.0
+    long_value = "1234567890123456789"
+    assert (parse_gerber_value(long_value, (2, 5), "none") ==
+            float("12.34567890123456789"))
+
+
 def test_parse_format_validation():
     """ Test parse_gerber_value() format validation
     """
@@ -165,3 +176,11 @@ def test_convex_hull():
     points = [(0, 0), (1, 0), (1, 1), (0.5, 0.5), (0, 1), (0, 0)]
     expected = [(0, 0), (1, 0), (1, 1), (0, 1), (0, 0)]
     assert set(convex_hull(points)) == set(expected)
+
+
+def test_bounding_box_union():
+    boxes = [((0, 1), (0, 1)), ((-1, 0.5), (2, 3)), ((0.5, 4), (-2, 0))]
+    assert bounding_box_union(boxes) == ((-1, 4), (-2, 3))
+    assert bounding_box_union(boxes[:1]) == boxes[0]
+    assert bounding_box_union(iter(boxes)) == ((-1, 4), (-2, 3))
+    pytest.raises(ValueError, bounding_box_union, [])
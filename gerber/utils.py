@@ -24,10 +24,41 @@ files.
 """
 
 import os
-from math import radians, sin, cos, sqrt, atan2, pi
+from math import radians, sin, cos, atan2, hypot, pi
 
 MILLIMETERS_PER_INCH = 25.4
 
+# Exact powers of ten used to place the decimal point in fixed point values.
+# Covers every shift of a value short enough to be parsed as an exact integer.
+_POWERS_OF_TEN = tuple(10 ** n for n in range(16))
+_DECIMAL_SCALES = tuple(float(power) for power in _POWERS_OF_TEN)
+
+# Zero suppression modes in which values are padded out to the full format
+_PADDED_SUPPRESSION = frozenset(('trailing', 'leading'))
+
+# (integer digits, total digits) of each number format seen so far. A file
+# uses one format throughout, so it is only validated once.
+_FORMAT_DIGITS = {}
+
+
+def _format_digits(format):
+    """ Validate a number format and return its integer and total digits.
+    """
+    integer_digits, decimal_digits = format
+    max_digits = integer_digits + decimal_digits
+
+    # Absolute maximum number of digits supported. This will handle up to
+    # 6:7 format, which is somewhat supported, even though the gerber spec
+    # only allows up to 6:6
+    if max_digits > 13 or integer_digits > 6 or decimal_digits > 7:
+        raise ValueError('Parser only supports precision up to 6:7 format')
+    try:
+        _FORMAT_DIGITS[format] = (integer_digits, max_digits)
+    except TypeError:
+        # Unhashable format, e.g. a list: nothing to remember it by
+        pass
+    return integer_digits, max_digits
+
 
 def parse_gerber_value(value, format=(2, 5), zero_suppression='trailing'):
     """ Convert gerber/excellon formatted string to floating-point number
@@ -65,32 +96,46 @@ def parse_gerber_value(value, format=(2, 5), zero_suppression='trailing'):
         return float(value)
 
     # Format precision
-    integer_digits, decimal_digits = format
-    MAX_DIGITS = integer_digits + decimal_digits
-
-    # Absolute maximum number of digits supported. This will handle up to
-    # 6:7 format, which is somewhat supported, even though the gerber spec
-    # only allows up to 6:6
-    if MAX_DIGITS > 13 or integer_digits > 6 or decimal_digits > 7:
-        raise ValueError('Parser only supports precision up to 6:7 format')
-
-    # Remove extraneous information
-    value = value.lstrip('+')
-    negative = '-' in value
+    try:
+        integer_digits, MAX_DIGITS = _FORMAT_DIGITS[format]
+    except (KeyError, TypeError):
+        integer_digits, MAX_DIGITS = _format_digits(format)
+
+    # Remove extraneous information. Signs only ever lead the digits, and
+    # most values are unsigned and are used as they are.
+    negative = value[:1] == '-'
     if negative:
         value = value.lstrip('-')
-
-    missing_digits = MAX_DIGITS - len(value)
-
-    if zero_suppression == 'trailing':
-        digits = list(value + ('0' * missing_digits))
-    elif zero_suppression == 'leading':
-        digits = list(('0' * missing_digits) + value)
+    elif value[:1] == '+':
+        value = value.lstrip('+')
+        negative = value[:1] == '-'
+        if negative:
+            value = value.lstrip('-')
+
+    # The digits are a fixed point number: read them as one integer and
+    # scale by the number of decimal digits, padding with zeros per the
+    # suppression mode. Dividing the exact integer by an exact power of ten
+    # rounds the same way float() does on the equivalent decimal string.
+    length = len(value)
+    missing_digits = MAX_DIGITS - length
+    if length > 15:
+        # Too long to be held exactly in a double, and longer than any
+        # format, so there's no padding: let float() round the digits.
+        result = float(value[:integer_digits] + '.' + value[integer_digits:])
+        return -result if negative else result
+
+    if zero_suppression in _PADDED_SUPPRESSION:
+        result = int(value) if value else 0
+        if missing_digits > 0:
+            if zero_suppression == 'trailing':
+                result *= _POWERS_OF_TEN[missing_digits]
+            length = MAX_DIGITS
     else:
-        digits = list(value)
-
-    result = float(
-        ''.join(digits[:integer_digits] + ['.'] + digits[integer_digits:]))
+        result = int(value)
+    if length > integer_digits:
+        result /= _DECIMAL_SCALES[length - integer_digits]
+    else:
+        result = float(result)
     return -result if negative else result
 
 
@@ -144,27 +189,22 @@ def write_gerber_value(value, format=(2, 5), zero_suppression='trailing'):
     if negative:
         value = -1.0 * value
 
-    # Format string for padding out in both directions
+    # Format string for padding out in both directions. The zero padding
+    # and suppression are done by the str methods rather than per digit.
     fmtstring = '%%0%d.0%df' % (MAX_DIGITS + 1, decimal_digits)
-    digits = [val for val in fmtstring % value if val != '.']
-
-    # If all the digits are 0, return '0'.
-    digit_sum = sum([int(digit) for digit in digits])
-    if digit_sum == 0:
-        return '0'
+    digits = (fmtstring % value).replace('.', '')
 
     # Suppression...
     if zero_suppression == 'trailing':
-        while digits and digits[-1] == '0':
-            digits.pop()
+        digits = digits.rstrip('0')
     elif zero_suppression == 'leading':
-        while digits and digits[0] == '0':
-            digits.pop(0)
+        digits = digits.lstrip('0')
 
-    if not digits:
+    # If all the digits are 0, return '0'.
+    if not digits.strip('0'):
         return '0'
 
-    return ''.join(digits) if not negative else ''.join(['-'] + digits)
+    return digits if not negative else '-' + digits
 
 
 def decimal_string(value, precision=6, padding=False):
@@ -231,6 +271,21 @@ def detect_file_format(data):
 
 
 def validate_coordinates(position):
+    """ Check that a position is a 2-tuple of numbers.
+
+    Primitive constructors only call this when `__debug__` is set, so the
+    check is compiled out when running under `python -O`.
+
+    Parameters
+    ----------
+    position : tuple(<float>, <float>) or None
+        Coordinates to check. `None` is accepted as "no position".
+
+    Raises
+    ------
+    TypeError
+        If `position` is not a pair of integers or floats.
+    """
     if position is not None:
         if len(position) != 2:
             raise TypeError('Position must be a tuple (n=2) of coordinates')
@@ -313,6 +368,39 @@ def sq_distance(point1, point2):
     return diff1 * diff1 + diff2 * diff2
 
 
+def bounding_box_union(bounding_boxes):
+    """ Find the bounding box enclosing a collection of bounding boxes.
+
+    The limits are reduced in a single pass, so the boxes can be passed as a
+    generator and are never collected into intermediate lists.
+
+    Parameters
+    ----------
+    bounding_boxes : iterable
+        Bounding boxes as ((min x, max x), (min y, max y)). Must not be empty.
+
+    Returns
+    -------
+    bounding_box : tuple
+        ((min x, max x), (min y, max y)) of the union.
+    """
+    boxes = iter(bounding_boxes)
+    try:
+        (min_x, max_x), (min_y, max_y) = next(boxes)
+    except StopIteration:
+        raise ValueError('No bounding boxes to union')
+    for (x0, x1), (y0, y1) in boxes:
+        if x0 < min_x:
+            min_x = x0
+        if x1 > max_x:
+            max_x = x1
+        if y0 < min_y:
+            min_y = y0
+        if y1 > max_y:
+            max_y = y1
+    return ((min_x, max_x), (min_y, max_y))
+
+
 def listdir(directory, ignore_hidden=True, ignore_os=True):
     """ List files in given directory.
     Differs from os.listdir() in that hidden and OS-generated files are ignored
@@ -399,7 +487,7 @@ def _optimize(hull,points):
 
 def _distance(a, b, x):
     #find the distance between point x and line a-b
-    return abs((b[1]-a[1])*x[0]-(b[0]-a[0])*x[1]+b[0]*a[1]-a[0]*b[1])/sqrt((b[1]-a[1])**2 + (b[0]-a[0])**2 );
+    return abs((b[1]-a[1])*x[0]-(b[0]-a[0])*x[1]+b[0]*a[1]-a[0]*b[1])/hypot(b[1]-a[1], b[0]-a[0])
 
 def _findhull(idxp, a_i, b_i, points):
     #if no points in input, return no points in output